@@ -0,0 +1,79 @@
+"""Solve many inputs of one day concurrently, streaming results as JSON lines as soon as they are ready.
+
+Every worker imports the day module once (in pool initializer), so module level precomputation
+(e.g. day17 rock shapes, day22 cube faces) is done once per worker, not once per input.
+"""
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+import argparse
+import glob
+import json
+import os
+import sys
+
+from aoc import cache
+from aoc.days import discover, load
+from aoc.runner import run_solver
+
+
+def expand_inputs(specs: Iterable[str]) -> list[Path]:
+    """Files, directories (all files in them) and glob patterns."""
+    res = []
+    for spec in specs:
+        p = Path(spec)
+        if p.is_dir():
+            res += sorted(c for c in p.iterdir() if c.is_file())
+        elif p.exists():
+            res.append(p)
+        else:
+            res += sorted(Path(m) for m in glob.glob(spec, recursive=True))
+    return res
+
+
+def solve_one(day: int, parts: list[str] | None, input_txt: Path) -> dict:
+    res = {"input": str(input_txt), "day": day, "answers": {}, "seconds": {}}
+    for s in discover(day):
+        if parts and s.part not in parts:
+            continue
+        try:
+            r = run_solver(s, input_txt)
+        except Exception as e:
+            res.setdefault("errors", {})[s.part] = repr(e)
+            continue
+        res["answers"][s.part] = r.answer.strip() if isinstance(r.answer, str) else r.answer
+        res["seconds"][s.part] = round(r.seconds, 6)
+    cache.clear()  # parts of this input are done, do not keep parsed inputs of the whole batch in memory
+    return res
+
+
+def solve_chunk(day: int, parts: list[str] | None, chunk: list[Path]) -> list[dict]:
+    return [solve_one(day, parts, input_txt) for input_txt in chunk]
+
+
+def solve_batch(day: int, inputs: list[Path], workers: int | None = None, chunksize: int = 1,
+                parts: list[str] | None = None) -> Iterator[dict]:
+    """Yield result of every input (in order of completion, not in order of inputs)."""
+    chunks = [inputs[i:i + chunksize] for i in range(0, len(inputs), chunksize)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=load, initargs=(day,)) as pool:
+        futures = [pool.submit(solve_chunk, day, parts, c) for c in chunks]
+        for f in as_completed(futures):
+            yield from f.result()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="aoc.batch", description="Solve many inputs of one day, print JSON lines.")
+    parser.add_argument("day", type=int)
+    parser.add_argument("inputs", nargs="+", help="input files, directories or glob patterns")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunksize", type=int, default=1, help="inputs sent to a worker at once")
+    parser.add_argument("--parts", help="comma separated, e.g. part1 (default: all)")
+    args = parser.parse_args(argv)
+
+    parts = args.parts.split(",") if args.parts else None
+    for res in solve_batch(args.day, expand_inputs(args.inputs), args.workers, args.chunksize, parts):
+        print(json.dumps(res), flush=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
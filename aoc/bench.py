@@ -0,0 +1,137 @@
+from contextlib import redirect_stdout
+from dataclasses import dataclass, asdict
+from pathlib import Path
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+from aoc import cache
+from aoc.days import DAYS, ROOT, Solver, discover, input_path
+from aoc.gen import generated_input
+
+BASELINE = ROOT / "bench_baseline.json"
+# timings below this are mostly noise, don't report them as regressions
+NOISE_FLOOR = 0.002
+
+
+@dataclass
+class Stats:
+    min: float
+    median: float
+    p95: float
+    peak_mem: int  # bytes, as seen by tracemalloc
+    repeats: int
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    k = (len(values) - 1) * p
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+def measure(solver: Solver, input_txt: Path, warmup: int, repeats: int) -> Stats:
+    # every run starts with an empty parse cache, otherwise parsing would vanish from timings and peaks
+    with redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            cache.clear()
+            solver.run(input_txt)
+        times = []
+        for _ in range(repeats):
+            cache.clear()
+            start = time.perf_counter()
+            solver.run(input_txt)
+            times.append(time.perf_counter() - start)
+        # separate run, tracemalloc slows allocations down and would spoil timings
+        cache.clear()
+        tracemalloc.start()
+        solver.run(input_txt)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return Stats(min(times), statistics.median(times), percentile(times, 0.95), peak, repeats)
+
+
+def bench_key(solver: Solver, input_txt: Path) -> str:
+    return f"day{solver.day:02d}/{solver.part}/{input_txt.name}"
+
+
+def bench_inputs(day: int, kinds: list[str], sizes: list[int], seed: int) -> list[Path]:
+    inputs = [input_path(day, sample=kind == "sample") for kind in kinds]
+    # generated inputs of growing sizes give scaling curve of a solver
+    inputs += [generated_input(day, size, seed) for size in sizes]
+    return [i for i in inputs if i.exists()]
+
+
+def run_bench(days: list[int], kinds: list[str], warmup: int, repeats: int,
+              sizes: list[int] = (), seed: int = 0) -> dict[str, Stats]:
+    res = {}
+    for d in days:
+        for input_txt in bench_inputs(d, kinds, sizes, seed):
+            for s in discover(d):
+                key = bench_key(s, input_txt)
+                res[key] = measure(s, input_txt, warmup, repeats)
+                print(f"{key:32} min {res[key].min:9.4f}s  median {res[key].median:9.4f}s  "
+                      f"p95 {res[key].p95:9.4f}s  peak {res[key].peak_mem / 2**20:8.2f}MiB", file=sys.stderr)
+    return res
+
+
+def load_baseline(path: Path) -> dict[str, Stats]:
+    with open(path) as f:
+        return {k: Stats(**v) for k, v in json.load(f).items()}
+
+
+def save_baseline(path: Path, stats: dict[str, Stats]):
+    with open(path, "w") as f:
+        json.dump({k: asdict(v) for k, v in stats.items()}, f, indent=2, sort_keys=True)
+
+
+def find_regressions(baseline: dict[str, Stats], current: dict[str, Stats], threshold: float) -> list[str]:
+    res = []
+    for key, now in current.items():
+        if key not in baseline:
+            continue
+        old = baseline[key]
+        if now.median > max(old.median, NOISE_FLOOR) * (1 + threshold):
+            res.append(f"{key}: median {old.median:.4f}s -> {now.median:.4f}s")
+    return res
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="aoc.bench", description="Benchmark solvers and check for regressions.")
+    parser.add_argument("days", nargs="*", type=int, default=list(DAYS))
+    parser.add_argument("--inputs", default="sample,input", help="comma separated: sample, input")
+    parser.add_argument("--sizes", default="", help="comma separated sizes of generated inputs (see aoc.gen)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="store results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown of median")
+    args = parser.parse_args(argv)
+
+    # parsed inputs pickled by earlier processes would hide parsing as well
+    os.environ.pop("AOC_PARSE_CACHE_DIR", None)
+    kinds = [k for k in args.inputs.split(",") if k]
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    current = run_bench(args.days, kinds, args.warmup, args.repeats, sizes, args.seed)
+    if args.save:
+        baseline = load_baseline(args.baseline) if args.baseline.exists() else {}
+        save_baseline(args.baseline, baseline | current)
+        return 0
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}, run with --save first", file=sys.stderr)
+        return 0
+    regressions = find_regressions(load_baseline(args.baseline), current, args.threshold)
+    for r in regressions:
+        print(f"REGRESSION {r}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
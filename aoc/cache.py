@@ -0,0 +1,151 @@
+"""Cache of parsed inputs, keyed by content hash of the input (and of the solver source).
+
+part1 and part2 (and repeated runs in one process) get parsed structures from memory (the MAX_PARSED most
+recently used ones). When AOC_PARSE_CACHE_DIR is set, parsed structures are also pickled to that directory,
+so the next process skips parsing too.
+The directory is kept below AOC_PARSE_CACHE_MAX_BYTES by evicting least recently used entries.
+"""
+from collections.abc import Callable
+import functools
+import os
+import sys
+
+from aoc.lazy import lazy_import
+
+# solvers import this module, keep their startup cheap
+hashlib = lazy_import("hashlib")
+pathlib = lazy_import("pathlib")
+pickle = lazy_import("pickle")
+
+DEFAULT_MAX_BYTES = 256 * 2 ** 20
+# in-memory entries, least recently used are dropped, so long-lived processes (aoc.daemon) do not grow forever
+MAX_PARSED = 32
+MAX_FILE_HASHES = 256
+
+# both dicts are kept in LRU order, least recently used first
+_memory: dict[str, object] = {}
+_file_hashes: dict[str, tuple[int, int, str]] = {}  # path -> (size, mtime, hash)
+
+
+def remember(lru: dict, key, value, limit: int):
+    lru.pop(key, None)
+    lru[key] = value
+    while len(lru) > limit:
+        del lru[next(iter(lru))]
+
+
+def file_hash(path: str) -> str:
+    st = os.stat(path)
+    path = os.path.abspath(path)
+    cached = _file_hashes.get(path)
+    if cached is not None and cached[:2] == (st.st_size, st.st_mtime_ns):
+        digest = cached[2]
+    else:
+        h = hashlib.blake2b()
+        with open(path, "rb") as f:
+            while chunk := f.read(2 ** 20):
+                h.update(chunk)
+        digest = h.hexdigest()
+    remember(_file_hashes, path, (st.st_size, st.st_mtime_ns, digest), MAX_FILE_HASHES)
+    return digest
+
+
+def cache_dir() -> "pathlib.Path | None":
+    d = os.environ.get("AOC_PARSE_CACHE_DIR")
+    return pathlib.Path(d) if d else None
+
+
+def max_bytes() -> int:
+    return int(os.environ.get("AOC_PARSE_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+
+
+def load_from_disk(key: str) -> bytes | None:
+    d = cache_dir()
+    if d is None:
+        return None
+    path = d / f"{key}.pickle"
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    os.utime(path)  # mtime is our LRU clock
+    return data
+
+
+def store_on_disk(key: str, data: bytes):
+    d = cache_dir()
+    if d is None:
+        return
+    d.mkdir(parents=True, exist_ok=True)
+    tmp = d / f"{key}.{os.getpid()}.tmp"
+    tmp.write_bytes(data)
+    tmp.replace(d / f"{key}.pickle")
+    evict(d, max_bytes())
+
+
+def evict(d: "pathlib.Path", limit: int):
+    entries = []
+    for p in d.glob("*.pickle"):
+        try:
+            st = p.stat()
+        except OSError:
+            continue  # removed by other process in the meantime
+        entries.append((st.st_mtime_ns, st.st_size, p))
+    total = sum(size for _, size, _ in entries)
+    for _, size, p in sorted(entries):
+        if total <= limit:
+            break
+        p.unlink(missing_ok=True)
+        total -= size
+
+
+def clear():
+    _memory.clear()
+    _file_hashes.clear()
+
+
+def parse_cache(f: Callable = None, *, shared: bool = False) -> Callable:
+    """Cache result of parse function f(input_txt, *args).
+
+    Solvers often modify what they parsed, so every call gets its own copy (unpickled from cached bytes).
+    With shared=True all calls get the very same object, use it only when solvers treat the result as read-only.
+    """
+    if f is None:
+        return functools.partial(parse_cache, shared=shared)
+
+    source = sys.modules[f.__module__].__file__
+
+    @functools.wraps(f)
+    def wrapper(input_txt: str, *args):
+        # source hash in key, so changed parser never gets stale data from disk
+        source_hash = file_hash(source) if source else ""
+        key = hashlib.blake2b(repr((f.__module__, f.__qualname__, source_hash,
+                                    file_hash(input_txt), args)).encode(), digest_size=16).hexdigest()
+        if key in _memory:
+            _memory[key] = cached = _memory.pop(key)  # most recently used now
+            return cached if shared else pickle.loads(cached)
+        data = load_from_disk(key)
+        res = None
+        if data is not None:
+            try:
+                res = pickle.loads(data)
+            except Exception:
+                data = None  # e.g. pickled by a differently named module, just parse again
+        if data is None:
+            res = f(input_txt, *args)
+            if shared and cache_dir() is None:
+                # nothing to copy from and nowhere to store, bytes would be thrown away
+                remember(_memory, key, res, MAX_PARSED)
+                return res
+            try:
+                data = pickle.dumps(res, pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, RecursionError, TypeError, AttributeError):
+                # e.g. too deeply nested, still can be shared within process but cannot be copied
+                if shared:
+                    remember(_memory, key, res, MAX_PARSED)
+                return res
+            store_on_disk(key, data)
+        remember(_memory, key, res if shared else data, MAX_PARSED)
+        return res
+
+    return wrapper
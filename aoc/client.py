@@ -0,0 +1,51 @@
+"""Thin client of aoc.daemon, imports nothing but socket and json so that it starts as fast as Python can.
+
+Protocol (one request per connection): client sends a JSON header line {"day": 17, "part": "part1",
+"sample": false, "size": N} followed by N bytes of input; daemon replies with one JSON line.
+Header {"cmd": "stop"} stops the daemon.
+"""
+import json
+import os
+import socket
+import sys
+
+
+def socket_path() -> str:
+    return os.environ.get("AOC_DAEMON_SOCKET") or f"/tmp/aoc-daemon-{os.getuid()}.sock"
+
+
+def request(header: dict, data: bytes = b"", path: str | None = None) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(path or socket_path())
+        s.sendall(json.dumps({**header, "size": len(data)}).encode() + b"\n" + data)
+        with s.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def solve(day: int, data: bytes, part: str | None = None, sample: bool = False, path: str | None = None) -> dict:
+    return request({"day": day, "part": part, "sample": sample}, data, path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = sys.argv[1:] if argv is None else argv
+    sample = "--sample" in args
+    args = [a for a in args if a != "--sample"]
+    if args == ["stop"]:
+        print(json.dumps(request({"cmd": "stop"})))
+        return 0
+    if not 2 <= len(args) <= 3:
+        print("usage: python -m aoc.client DAY INPUT|- [PART] [--sample] | stop", file=sys.stderr)
+        return 2
+    day, input_txt, *part = args
+    if input_txt == "-":
+        data = sys.stdin.buffer.read()
+    else:
+        with open(input_txt, "rb") as f:
+            data = f.read()
+    res = solve(int(day), data, part[0] if part else None, sample)
+    print(json.dumps(res))
+    return 1 if "error" in res else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Long-lived solver daemon on a Unix socket (see aoc.client for the protocol).
+
+Worker processes import all days once when started, so a request pays neither interpreter startup nor imports,
+and repeated requests with the same input also hit the workers' parse cache (see aoc.cache).
+"""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import argparse
+import json
+import os
+import socketserver
+import tempfile
+import time
+
+from aoc.client import socket_path
+from aoc.days import DAYS, discover, load
+from aoc.runner import run_solver
+
+
+def preload():
+    for d in DAYS:
+        try:
+            load(d)
+        except ImportError:
+            pass  # reported on request of that day
+
+
+def handle(pool: ProcessPoolExecutor, tmp: Path, header: dict, data: bytes) -> dict:
+    start = time.perf_counter()
+    day = int(header["day"])
+    part = header.get("part")
+    solvers = [s for s in discover(day) if part in (None, s.part)]
+    if not solvers:
+        raise ValueError(f"day {day} has no {part}")
+    # solvers read files, sample.txt name selects sample arguments (see Solver.call_args)
+    with tempfile.TemporaryDirectory(dir=tmp) as d:
+        input_txt = Path(d) / ("sample.txt" if header.get("sample") else "input.txt")
+        input_txt.write_bytes(data)
+        futures = [pool.submit(run_solver, s, input_txt) for s in solvers]
+        results = [f.result() for f in futures]
+    return {
+        "day": day,
+        "answers": {r.solver.part: r.answer for r in results},
+        "seconds": {r.solver.part: r.seconds for r in results},
+        "wall": time.perf_counter() - start,
+    }
+
+
+class Handler(socketserver.StreamRequestHandler):
+    server: "Server"
+
+    def handle(self):
+        try:
+            header = json.loads(self.rfile.readline())
+            data = self.rfile.read(header.get("size", 0))
+            if header.get("cmd") == "stop":
+                self.wfile.write(b'{"stopped": true}\n')
+                self.server.shutdown()  # fine from a handler thread, serve_forever runs in the main one
+                return
+            res = handle(self.server.pool, self.server.tmp, header, data)
+        except Exception as e:
+            res = {"error": repr(e)}
+        self.wfile.write(json.dumps(res, default=str).encode() + b"\n")
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, pool: ProcessPoolExecutor, tmp: Path):
+        self.pool = pool
+        self.tmp = tmp
+        super().__init__(path, Handler)
+
+
+def serve(path: str, workers: int):
+    if os.path.exists(path):
+        os.unlink(path)  # stale socket of a killed daemon
+    with (tempfile.TemporaryDirectory(prefix="aoc-daemon-") as tmp,
+          ProcessPoolExecutor(max_workers=workers, initializer=preload) as pool):
+        # start (and warm up) all workers now, not on the first requests
+        for f in [pool.submit(os.getpid) for _ in range(workers)]:
+            f.result()
+        preload()  # requests are dispatched by discover() in this process
+        with Server(path, pool, Path(tmp)) as server:
+            print(f"listening on {path}", flush=True)
+            try:
+                server.serve_forever(poll_interval=0.1)
+            finally:
+                os.unlink(path)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="aoc.daemon", description="Serve solvers on a Unix socket.")
+    parser.add_argument("--socket", default=socket_path())
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--fast-model", action="store_true", help="slots dataclasses instead of pydantic (see aoc.model)")
+    args = parser.parse_args(argv)
+    if args.fast_model:
+        os.environ["AOC_FAST_MODEL"] = "1"  # before any day is imported, also by workers
+    serve(args.socket, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+import importlib
+
+ROOT = Path(__file__).resolve().parent.parent
+DAYS = range(1, 26)
+
+# solvers which do not follow plain part1(input_txt) / part2(input_txt) convention
+# (day, part) -> (function name, args for real input, args for sample)
+SPECIAL = {
+    (14, "part1"): ("solve", (True,), (True,)),
+    (14, "part2"): ("solve", (False,), (False,)),
+    (15, "part1"): ("part1", (2_000_000,), (10,)),
+    (15, "part2"): ("part2", (4_000_000,), (20,)),
+}
+
+# rough cost ranking of whole days (slowest first), used to schedule long jobs early
+SLOWEST_FIRST = [16, 15, 19, 24, 11, 23, 20, 17, 14, 22, 18, 13]
+
+
+@dataclass(frozen=True)
+class Solver:
+    day: int
+    part: str  # "part1", "part2" or "solve" (when one call answers both parts)
+    func: str
+    args: tuple = ()
+    sample_args: tuple = ()
+
+    @property
+    def module_name(self) -> str:
+        return module_name(self.day)
+
+    def call_args(self, input_txt: str | Path) -> tuple:
+        args = self.sample_args if Path(input_txt).name == "sample.txt" else self.args
+        return str(input_txt), *args
+
+    def run(self, input_txt: str | Path):
+        f = getattr(importlib.import_module(self.module_name), self.func)
+        return f(*self.call_args(input_txt))
+
+
+def module_name(day: int) -> str:
+    return f"day{day:02d}.solve"
+
+
+def day_dir(day: int) -> Path:
+    return ROOT / f"day{day:02d}"
+
+
+def input_path(day: int, sample: bool = False) -> Path:
+    d = day_dir(day)
+    if sample:
+        return d / "sample.txt"
+    # first days keep their puzzle input in part1.txt
+    return d / "input.txt" if (d / "input.txt").exists() else d / "part1.txt"
+
+
+def load(day: int) -> ModuleType:
+    return importlib.import_module(module_name(day))
+
+
+def discover(day: int) -> list[Solver]:
+    m = load(day)
+    solvers = []
+    for part in ("part1", "part2"):
+        if (day, part) in SPECIAL:
+            func, args, sample_args = SPECIAL[day, part]
+            solvers.append(Solver(day, part, func, args, sample_args))
+        elif hasattr(m, part):
+            solvers.append(Solver(day, part, part))
+    if not solvers and hasattr(m, "solve"):
+        solvers.append(Solver(day, "solve", "solve"))
+    return solvers
+
+
+def cost_rank(day: int) -> int:
+    return SLOWEST_FIRST.index(day) if day in SLOWEST_FIRST else len(SLOWEST_FIRST)
@@ -0,0 +1,453 @@
+"""Seeded generators of (possibly huge) synthetic puzzle inputs, one per day.
+
+Every generator takes random.Random and size and returns input text in the same format as real puzzle input.
+Meaning of size differs per day (number of elves, lines, grid side, valves...), see docstrings.
+"""
+from pathlib import Path
+from string import ascii_letters, ascii_lowercase, ascii_uppercase
+import argparse
+import random
+
+from aoc.days import ROOT
+
+GENERATED_DIR = ROOT / "generated"
+DAY24_MAX_MINUTES = 1_000  # day24 solver precomputes blizzards of that many minutes
+
+
+def gen_day01(rng: random.Random, size: int) -> str:
+    """size: number of elves"""
+    elves = ("\n".join(str(rng.randint(1000, 70000)) for _ in range(rng.randint(1, 15))) for _ in range(size))
+    return "\n\n".join(elves) + "\n"
+
+
+def gen_day02(rng: random.Random, size: int) -> str:
+    """size: number of rounds"""
+    return "".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}\n" for _ in range(size))
+
+
+def gen_day03(rng: random.Random, size: int) -> str:
+    """size: number of elf groups (3 rucksacks each)"""
+    lines = []
+    for _ in range(size):
+        letters = list(ascii_letters)
+        rng.shuffle(letters)
+        badge, letters = letters[0], letters[1:]
+        for i in range(3):
+            pool = letters[i * 17:(i + 1) * 17]  # elves of one group share nothing but the badge
+            common, left_pool, right_pool = pool[0], pool[1:9], pool[9:]
+            half = rng.randint(4, 16)
+            left = [common, badge] + rng.choices(left_pool, k=half - 2)
+            right = [common] + rng.choices(right_pool, k=half - 1)
+            rng.shuffle(left)
+            rng.shuffle(right)
+            lines.append("".join(left + right))
+    return "\n".join(lines) + "\n"
+
+
+def gen_day04(rng: random.Random, size: int) -> str:
+    """size: number of assignment pairs"""
+    lines = []
+    for _ in range(size):
+        a, b = sorted(rng.choices(range(1, 100), k=2))
+        c, d = sorted(rng.choices(range(1, 100), k=2))
+        lines.append(f"{a}-{b},{c}-{d}\n")
+    return "".join(lines)
+
+
+def gen_day05(rng: random.Random, size: int) -> str:
+    """size: number of moves (9 stacks, as in real input)"""
+    stacks = [[rng.choice(ascii_uppercase) for _ in range(rng.randint(2, 8))] for _ in range(9)]
+    height = max(len(s) for s in stacks)
+    drawing = []
+    for level in reversed(range(height)):
+        drawing.append(" ".join(f"[{s[level]}]" if level < len(s) else "   " for s in stacks))
+    drawing.append(" ".join(f" {i + 1} " for i in range(9)))
+    sizes = [len(s) for s in stacks]
+    moves = []
+    for _ in range(size):
+        # never take the last crate, the top of every stack is reported at the end
+        src = rng.choice([i for i, s in enumerate(sizes) if s > 1])
+        dst = rng.choice([i for i in range(9) if i != src])
+        count = rng.randint(1, sizes[src] - 1)
+        sizes[src] -= count
+        sizes[dst] += count
+        moves.append(f"move {count} from {src + 1} to {dst + 1}")
+    return "\n".join(drawing) + "\n\n" + "\n".join(moves)
+
+
+def gen_day06(rng: random.Random, size: int) -> str:
+    """size: length of datastream; markers are only at the very end (worst case for scanning)"""
+    marker = rng.sample(ascii_lowercase, 14)
+    # only 3 distinct letters, so neither 4 nor 14 letters long marker can appear before the real one
+    return "".join(rng.choices(marker[:3], k=size)) + "".join(marker) + "\n"
+
+
+def gen_day07(rng: random.Random, size: int) -> str:
+    """size: number of directories"""
+    children = [[] for _ in range(size)]
+    for d in range(1, size):
+        children[rng.randrange(d)].append(d)
+    lines = ["$ cd /"]
+    stack = [(0, False)]
+    while stack:
+        d, visited = stack.pop()
+        if visited:
+            if d != 0:
+                lines.append("$ cd ..")
+            continue
+        if d != 0:
+            lines.append(f"$ cd d{d}")
+        lines.append("$ ls")
+        for c in children[d]:
+            lines.append(f"dir d{c}")
+        for i in range(rng.randint(0, 5)):
+            lines.append(f"{rng.randint(1, 300_000)} f{i}.{rng.choice(['txt', 'dat', 'log'])}")
+        stack.append((d, True))
+        stack += [(c, False) for c in reversed(children[d])]
+    return "\n".join(lines) + "\n"
+
+
+def gen_day08(rng: random.Random, size: int) -> str:
+    """size: side of square forest"""
+    return "".join("".join(rng.choices("0123456789", k=size)) + "\n" for _ in range(size))
+
+
+def gen_day09(rng: random.Random, size: int) -> str:
+    """size: number of moves"""
+    return "".join(f"{rng.choice('RLUD')} {rng.randint(1, 20)}\n" for _ in range(size))
+
+
+def gen_day10(rng: random.Random, size: int) -> str:
+    """size: number of instructions (at least 240 are emitted, to fill the whole screen)"""
+    lines = []
+    x = 1
+    for _ in range(max(size, 240)):
+        if rng.random() < 0.3:
+            lines.append("noop")
+        else:
+            # keep sprite on the screen, so something gets drawn
+            v = rng.randint(max(-x, -15), min(39 - x, 15))
+            x += v
+            lines.append(f"addx {v}")
+    return "\n".join(lines) + "\n"
+
+
+def gen_day11(rng: random.Random, size: int) -> str:
+    """size: number of monkeys (at least 3)"""
+    size = max(size, 3)
+    primes = [p for p in range(2, 10 * size + 30) if all(p % d for d in range(2, int(p ** 0.5) + 1))]
+    divisors = rng.sample(primes, size)
+    monkeys = []
+    for i in range(size):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        # only monkey 0 squares and nobody throws back to it, otherwise part1 worry levels explode
+        op = "old * old" if i == 0 else rng.choice([f"old * {rng.randint(2, 19)}", f"old + {rng.randint(1, 8)}"])
+        targets = [m for m in range(1, size) if m != i]
+        if_true, if_false = rng.sample(targets, 2) if len(targets) > 1 else targets * 2
+        monkeys.append(f"Monkey {i}:\n"
+                       f"  Starting items: {items}\n"
+                       f"  Operation: new = {op}\n"
+                       f"  Test: divisible by {divisors[i]}\n"
+                       f"    If true: throw to monkey {if_true}\n"
+                       f"    If false: throw to monkey {if_false}\n")
+    return "\n".join(monkeys)
+
+
+def gen_day12(rng: random.Random, size: int) -> str:
+    """size: side of square heightmap (at least 14, so there is room to climb from a to z)"""
+    size = max(size, 14)
+
+    def heights(pits: list[tuple[int, int, int]]) -> list[list[int]]:
+        return [[min(r + abs(x - px) + abs(y - py) for px, py, r in pits) for x in range(size)] for y in range(size)]
+
+    # distance to random "pits" is 1-Lipschitz, so after scaling down to a..z
+    # neighbours differ by at most 1 and E is always reachable from anywhere
+    f = heights([(rng.randrange(size), rng.randrange(size), rng.randint(0, size)) for _ in range(4)])
+    lo = min(min(row) for row in f)
+    hi = max(max(row) for row in f)
+    if hi - lo < 25:
+        # E must be "z", pits too close to each other; one pit in a corner spans 2 * (size - 1) > 25
+        f = heights([(0, 0, 0)])
+        lo, hi = 0, 2 * (size - 1)
+    scale = 25 / max(hi - lo, 25)
+    rows = [[ascii_lowercase[int((v - lo) * scale)] for v in row] for row in f]
+    top = max(max(row) for row in rows)
+    lowest = [(x, y) for y, row in enumerate(rows) for x, v in enumerate(row) if v == "a"]
+    highest = [(x, y) for y, row in enumerate(rows) for x, v in enumerate(row) if v == top]
+    sx, sy = rng.choice(lowest)
+    ex, ey = rng.choice(highest)
+    rows[sy][sx] = "S"
+    rows[ey][ex] = "E"
+    return "".join("".join(row) + "\n" for row in rows)
+
+
+def gen_packet(rng: random.Random, depth: int) -> list:
+    res = []
+    for _ in range(rng.randint(0, 5)):
+        if depth > 0 and rng.random() < 0.3:
+            res.append(gen_packet(rng, depth - 1))
+        else:
+            res.append(rng.randint(0, 10))
+    return res
+
+
+def gen_day13(rng: random.Random, size: int) -> str:
+    """size: number of packet pairs"""
+    pairs = []
+    for _ in range(size):
+        a, b = gen_packet(rng, 4), gen_packet(rng, 4)
+        pairs.append(f"{a}\n{b}".replace(" ", ""))
+    return "\n\n".join(pairs) + "\n"
+
+
+def gen_day14(rng: random.Random, size: int) -> str:
+    """size: number of rock paths (cave stays within solver's fixed 1009x1009 grid)"""
+    lines = []
+    for _ in range(size):
+        x, y = rng.randint(420, 580), rng.randint(10, 170)
+        points = [(x, y)]
+        for _ in range(rng.randint(1, 6)):
+            if rng.random() < 0.5:
+                x = min(max(x + rng.randint(-10, 10), 400), 600)
+            else:
+                y = min(max(y + rng.randint(-10, 10), 5), 180)
+            points.append((x, y))
+        lines.append(" -> ".join(f"{px},{py}" for px, py in points))
+    return "\n".join(lines) + "\n"
+
+
+def gen_day15(rng: random.Random, size: int) -> str:
+    """size: number of sensors (plus 8 which make the distress beacon position unique)"""
+    m = 4_000_000
+    hx, hy = rng.randint(0, m), rng.randint(0, m)
+    sensors = []
+    # 4 sensors on axes and 4 on diagonals with beacons just out of reach of (hx, hy) cover whole search area
+    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)):
+        sx, sy = hx + dx * m, hy + dy * m
+        r = abs(dx * m) + abs(dy * m) - 1
+        sensors.append((sx, sy, sx - dx * r if dy == 0 else sx, sy - dy * r if dy != 0 else sy))
+    while len(sensors) < size + 8:
+        sx, sy = rng.randint(0, m), rng.randint(0, m)
+        if (sx, sy) == (hx, hy):
+            continue
+        r = rng.randint(0, abs(sx - hx) + abs(sy - hy) - 1)
+        rx = rng.randint(-r, r)
+        sensors.append((sx, sy, sx + rx, sy + rng.choice([-1, 1]) * (r - abs(rx))))
+    rng.shuffle(sensors)
+    return "".join(f"Sensor at x={sx}, y={sy}: closest beacon is at x={bx}, y={by}\n" for sx, sy, bx, by in sensors)
+
+
+def gen_day16(rng: random.Random, size: int) -> str:
+    """size: number of valves (2 to 676 two-letter names); around a third of them (at most 15) have positive flow rate"""
+    size = min(max(size, 2), len(ascii_uppercase) ** 2)
+    names = ["AA"] + rng.sample([a + b for a in ascii_uppercase for b in ascii_uppercase if a + b != "AA"], size - 1)
+    edges = [set() for _ in range(size)]
+    for v in range(1, size):
+        u = rng.randrange(v)  # random spanning tree keeps graph connected
+        edges[u].add(v)
+        edges[v].add(u)
+    for _ in range(size // 2):
+        u, v = rng.sample(range(size), 2)
+        edges[u].add(v)
+        edges[v].add(u)
+    with_flow = set(rng.sample(range(1, size), min(size // 3, 15)))
+    lines = []
+    for v in range(size):
+        rate = rng.randint(2, 25) if v in with_flow else 0
+        dst = [names[u] for u in edges[v]]
+        if len(dst) == 1:
+            lines.append(f"Valve {names[v]} has flow rate={rate}; tunnel leads to valve {dst[0]}")
+        else:
+            lines.append(f"Valve {names[v]} has flow rate={rate}; tunnels lead to valves {', '.join(dst)}")
+    return "\n".join(lines) + "\n"
+
+
+def gen_day17(rng: random.Random, size: int) -> str:
+    """size: length of jet pattern (part2 needs a cycle within 7000 rocks, so keep it below ~10k)"""
+    return "".join(rng.choices("<>", k=size)) + "\n"
+
+
+def gen_day18(rng: random.Random, size: int) -> str:
+    """size: number of cubes"""
+    side = max(int((size * 3) ** (1 / 3)), 2)
+    cubes = set()
+    while len(cubes) < min(size, side ** 3):
+        cubes.add((rng.randrange(side), rng.randrange(side), rng.randrange(side)))
+    return "".join(f"{x},{y},{z}\n" for x, y, z in cubes)
+
+
+def gen_day19(rng: random.Random, size: int) -> str:
+    """size: number of blueprints"""
+    lines = []
+    for i in range(1, size + 1):
+        lines.append(f"Blueprint {i}: "
+                     f"Each ore robot costs {rng.randint(2, 4)} ore. "
+                     f"Each clay robot costs {rng.randint(2, 4)} ore. "
+                     f"Each obsidian robot costs {rng.randint(2, 4)} ore and {rng.randint(5, 20)} clay. "
+                     f"Each geode robot costs {rng.randint(2, 4)} ore and {rng.randint(7, 20)} obsidian.")
+    return "\n".join(lines) + "\n"
+
+
+def gen_day20(rng: random.Random, size: int) -> str:
+    """size: length of the list to mix (exactly one 0 in it)"""
+    values = [rng.choice([-1, 1]) * rng.randint(1, 10_000) for _ in range(size - 1)]
+    values.insert(rng.randint(0, size - 1), 0)
+    return "".join(f"{v}\n" for v in values)
+
+
+def gen_day21(rng: random.Random, size: int) -> str:
+    """size: number of monkeys (at least 5; every operation has two operands, so an even size gets one more)"""
+    size = max(size, 5) | 1
+    names = iter(n for n in ("".join(ascii_lowercase[i // 26 ** k % 26] for k in range(4))
+                             for i in rng.sample(range(26 ** 4), size + 2)) if n not in ("root", "humn"))
+    lines = []
+
+    def expr(v: int, budget: int, human: bool) -> str:
+        # build subtree with value v, every operation is exact, so part2 can invert them
+        # budget: number of monkeys of the subtree, always odd
+        name = "humn" if human and budget == 1 else next(names)
+        if budget == 1:
+            lines.append(f"{name}: {v}")
+            return name
+        ops = ["-", "/"] + (["+"] if v >= 2 else []) + (["*"] if any(v % d == 0 for d in range(2, 10)) else [])
+        op = rng.choice(ops)
+        match op:
+            case "+":
+                a = rng.randint(1, v - 1)
+                x, y = a, v - a
+            case "-":
+                b = rng.randint(1, 100)
+                x, y = v + b, b
+            case "*":
+                b = rng.choice([d for d in range(2, 10) if v % d == 0])
+                x, y = v // b, b
+            case _:
+                b = rng.randint(2, 9)
+                x, y = v * b, b
+        left = rng.randrange(1, budget - 1, 2)
+        human_left = human and rng.random() < 0.5
+        lx = expr(x, left, human_left)
+        ly = expr(y, budget - 1 - left, human and not human_left)
+        lines.append(f"{name}: {lx} {op} {ly}")
+        return name
+
+    target = rng.randint(1000, 100_000)
+    left = rng.randrange(1, size - 1, 2)
+    x = expr(target, left, True)
+    y = expr(target, size - 1 - left, False)
+    lines.append(f"root: {x} + {y}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def gen_day22(rng: random.Random, size: int) -> str:
+    """size: number of moves; the map has layout and face size (50) of real input, part2 relies on it"""
+    faces = [(1, 0), (2, 0), (1, 1), (0, 2), (1, 2), (0, 3)]
+    rows = []
+    for y in range(200):
+        row = [" "] * 150
+        for fx, fy in faces:
+            if fy == y // 50:
+                for x in range(fx * 50, fx * 50 + 50):
+                    row[x] = "#" if rng.random() < 0.05 else "."
+        rows.append(row)
+    rows[0][50] = "."  # start tile must be open
+    rows = ["".join(row).rstrip() for row in rows]
+    moves = [str(rng.randint(1, 50))]
+    for _ in range(size):
+        moves.append(rng.choice("LR") + str(rng.randint(1, 50)))
+    return "\n".join(rows) + "\n\n" + "".join(moves)
+
+
+def gen_day23(rng: random.Random, size: int) -> str:
+    """size: side of square scan"""
+    return "".join("".join("#" if rng.random() < 0.5 else "." for _ in range(size)) + "\n" for _ in range(size))
+
+
+def crossing_minute(w: int, h: int, blizzards: list[tuple[int, int, int, int]]) -> int | None:
+    """Minute the third crossing of the valley (there, back, there again) ends at the earliest, None when it is
+    not early enough for day24 solver, which knows blizzards of DAY24_MAX_MINUTES minutes only."""
+    entrance, exit_ = (0, -1), (w - 1, h)
+    here, goal = {entrance}, exit_
+    crossed = 0
+    # the solver looks one minute past the states it takes, so the last crossing must end 2 minutes before
+    for minute in range(1, DAY24_MAX_MINUTES - 1):
+        occupied = {((x + minute * dx) % w, (y + minute * dy) % h) for x, y, dx, dy in blizzards}
+        reached = set()
+        for x, y in here:
+            for nx, ny in ((x, y), (x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if 0 <= nx < w and 0 <= ny < h:
+                    if (nx, ny) not in occupied:
+                        reached.add((nx, ny))
+                elif (nx, ny) == goal or (nx, ny) == (x, y):  # wait at the entrance we came from
+                    reached.add((nx, ny))
+        if goal in reached:
+            crossed += 1
+            if crossed == 3:
+                return minute
+            here, goal = {goal}, entrance if goal == exit_ else exit_
+        else:
+            here = reached
+    return None
+
+
+def gen_day24(rng: random.Random, size: int) -> str:
+    """size: width of the valley (height is a fifth of it, at least 3 by 2); every valley can be crossed there,
+    back and there again within the minutes the solver handles"""
+    w, h = max(size, 3), max(size // 5, 2)
+    dirs = {"<": (-1, 0), ">": (1, 0), "^": (0, -1), "v": (0, 1)}
+    while True:
+        rows = []
+        for y in range(h):
+            # as in real inputs, no vertical blizzards in columns of the entrance and the exit
+            rows.append("".join(rng.choice("<>" if x in (0, w - 1) else "<>^v") if rng.random() < 0.3 else "."
+                                for x in range(w)))
+        blizzards = [(x, y, *dirs[v]) for y, row in enumerate(rows) for x, v in enumerate(row) if v != "."]
+        if crossing_minute(w, h, blizzards) is not None:
+            break
+    lines = ["#." + "#" * w] + ["#" + row + "#" for row in rows] + ["#" * w + ".#"]
+    return "\n".join(lines) + "\n"
+
+
+def to_snafu(x: int) -> str:
+    digits = []
+    while x:
+        x, d = divmod(x + 2, 5)
+        digits.append("=-012"[d])
+    return "".join(reversed(digits))
+
+
+def gen_day25(rng: random.Random, size: int) -> str:
+    """size: number of SNAFU numbers"""
+    return "".join(to_snafu(rng.randint(1, 10 ** rng.randint(1, 12))) + "\n" for _ in range(size))
+
+
+GENERATORS = {int(name[-2:]): f for name, f in list(globals().items()) if name.startswith("gen_day")}
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    return GENERATORS[day](random.Random(seed), size)
+
+
+def generated_input(day: int, size: int, seed: int = 0) -> Path:
+    # same (day, size, seed) always gives the same file, so it is generated only once
+    path = GENERATED_DIR / f"day{day:02d}" / f"gen-{size}-{seed}.txt"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(generate(day, size, seed))
+        tmp.rename(path)
+    return path
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="aoc.gen", description="Generate synthetic puzzle input.")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    print(generate(args.day, args.size, args.seed), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""Lazy imports: module is really loaded on first attribute access, not when it is imported.
+
+importlib.util.LazyLoader would do, but importing importlib.util costs about as much as the modules we defer.
+"""
+from types import ModuleType
+import sys
+
+
+class LazyModule(ModuleType):
+    def __getattr__(self, attr: str):
+        # called only for missing attributes, so after the first access this is plain module lookup
+        __import__(self.__name__)
+        module = sys.modules[self.__name__]
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    return sys.modules.get(name) or LazyModule(name)
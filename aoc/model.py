@@ -0,0 +1,16 @@
+"""Dataclass decorator for solvers' models.
+
+By default it is pydantic's, so every construction is validated. With AOC_FAST_MODEL=1 it is plain dataclass
+with __slots__ and pydantic is not even imported (it is the most expensive import of all solvers).
+In that mode values are converted and checked only where input is parsed (from_str, parse_* functions).
+"""
+import dataclasses
+import os
+
+FAST = os.environ.get("AOC_FAST_MODEL", "") not in ("", "0")
+
+if FAST:
+    def dataclass(cls=None, /, **kwargs):
+        return dataclasses.dataclass(cls, slots=True, **kwargs)
+else:
+    from pydantic.dataclasses import dataclass
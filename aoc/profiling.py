@@ -0,0 +1,135 @@
+"""Profiling of single solver run: collapsed stacks (for flamegraph.pl, speedscope, ...) and top-N table.
+
+Two profilers: deterministic cProfile (exact call counts, collapsed stacks are reconstructed from caller
+graph, so they are approximate) and a sampling one (a thread snapshotting solver's stack every interval,
+real stacks, low overhead, but short solvers get only a few samples).
+"""
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from types import CodeType, FrameType
+import cProfile
+import io
+import pstats
+import sys
+import threading
+
+PROFILERS = ("cprofile", "sample")
+
+
+def label(code: CodeType) -> str:
+    # collapsed format uses ";" as separator and " " before count
+    return f"{code.co_qualname}({Path(code.co_filename).name}:{code.co_firstlineno})".replace(" ", "_")
+
+
+def frame_stack(frame: FrameType, root: CodeType) -> list[str] | None:
+    """Stack of frames called by root, None when root is not running (e.g. before it starts or after it returned)."""
+    stack = []
+    while frame is not None and frame.f_code is not root:
+        stack.append(label(frame.f_code))
+        frame = frame.f_back
+    return stack[::-1] if frame is not None else None
+
+
+class Sampler:
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.samples = Counter()
+        self.stop = threading.Event()
+
+    def _run(self, thread_id: int, root: CodeType):
+        while not self.stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is not None and (stack := frame_stack(frame, root)) is not None:
+                self.samples[";".join(stack)] += 1
+
+    def profile(self, f: Callable, *args):
+        def root():
+            return f(*args)
+
+        # sampler thread only gets GIL on thread switch, make switches as frequent as sampling
+        old_interval = sys.getswitchinterval()
+        sys.setswitchinterval(self.interval)
+        t = threading.Thread(target=self._run, args=(threading.get_ident(), root.__code__), daemon=True)
+        t.start()
+        try:
+            return root()
+        finally:
+            self.stop.set()
+            t.join()
+            sys.setswitchinterval(old_interval)
+
+    def collapsed(self) -> Counter:
+        return Counter({stack: n for stack, n in self.samples.items() if stack})
+
+    def top(self, n: int) -> str:
+        own = Counter()
+        total = Counter()
+        for stack, count in self.samples.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for fn in set(frames):
+                total[fn] += count
+        all_samples = sum(self.samples.values()) or 1
+        lines = [f"{'self%':>6} {'total%':>6}  function ({all_samples} samples, {self.interval * 1000:g}ms interval)"]
+        for fn, count in own.most_common(n):
+            lines.append(f"{count * 100 / all_samples:6.1f} {total[fn] * 100 / all_samples:6.1f}  {fn}")
+        return "\n".join(lines)
+
+
+def collapsed_from_cprofile(stats: pstats.Stats, max_depth: int = 64) -> Counter:
+    # pstats keeps only caller -> callee edges, so time of a function is split among its callers
+    # proportionally to cumulative time spent from each of them (as flameprof does)
+    entries = stats.stats
+    callees = {}
+    for fn, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, ct) in callers.items():
+            callees.setdefault(caller, []).append((fn, ct))
+    res = Counter()
+
+    def name(fn: tuple) -> str:
+        filename, line, func = fn
+        return f"{func}({Path(filename).name}:{line})".replace(" ", "_").replace(";", ",")
+
+    def walk(fn: tuple, path: list[str], on_path: set, ratio: float):
+        _, _, tt, ct, _ = entries[fn]
+        path = path + [name(fn)]
+        us = int(tt * ratio * 1_000_000)
+        if us:
+            res[";".join(path)] += us
+        if len(path) >= max_depth:
+            return
+        for callee, edge_ct in callees.get(fn, []):
+            callee_ct = entries[callee][3]
+            if callee in on_path or callee_ct <= 0:
+                continue  # recursion is folded into the first occurrence
+            walk(callee, path, on_path | {callee}, ratio * edge_ct / callee_ct)
+
+    roots = [fn for fn, (_, _, _, _, callers) in entries.items() if not callers]
+    for r in roots:
+        walk(r, [], {r}, 1.0)
+    return res
+
+
+def write_collapsed(path: Path, stacks: Counter):
+    with open(path, "w") as f:
+        for stack, count in sorted(stacks.items()):
+            f.write(f"{stack} {count}\n")
+
+
+def profile_call(kind: str, out: Path, top: int, f: Callable, *args) -> tuple[object, str]:
+    """Run f(*args) under profiler, write out.folded (and out.prof for cprofile), return result and top table."""
+    out.parent.mkdir(parents=True, exist_ok=True)
+    if kind == "sample":
+        sampler = Sampler()
+        res = sampler.profile(f, *args)
+        write_collapsed(out.with_suffix(".folded"), sampler.collapsed())
+        return res, sampler.top(top)
+    prof = cProfile.Profile()
+    res = prof.runcall(f, *args)
+    prof.dump_stats(out.with_suffix(".prof"))
+    table = io.StringIO()
+    stats = pstats.Stats(prof, stream=table)
+    write_collapsed(out.with_suffix(".folded"), collapsed_from_cprofile(stats))
+    stats.sort_stats("tottime").print_stats(top)
+    return res, table.getvalue()
@@ -0,0 +1,110 @@
+"""Input reading: the input file is memory-mapped and read in bounded windows.
+
+Nothing is materialized for the whole file: lines are split (in C, by bytes.split) out of windows of at most
+WINDOW bytes, blank line separated blocks are memoryview slices of the mapping. So even multi-GB generated inputs
+are read in constant memory (as long as the solver itself does not keep everything). The mapping stays alive
+as long as any view of it, no file needs to be closed explicitly.
+"""
+from collections.abc import Iterator
+from itertools import repeat
+import mmap
+
+from aoc.lazy import lazy_import
+
+# solvers import this module, re (and enum it pulls in) is loaded only when a pattern is used
+re = lazy_import("re")
+
+Buffer = bytes | memoryview
+
+WINDOW = 2 ** 24  # bytes copied out of the mapped input at once
+
+# regex patterns, compiled on first use (and then cached by re)
+BLANK_LINES = rb"\n(?:[ \t\r]*\n)+"
+INT = rb"-?\d+"
+UINT = rb"\d+"
+
+STRIPPED = b" \t\r"
+
+
+def mapped(input_txt: str) -> memoryview:
+    with open(input_txt, "rb") as f:
+        try:
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except ValueError:
+            return memoryview(b"")  # empty file cannot be mapped
+
+
+def chunk_ranges(buf: Buffer, n: int, sep: bytes = b"\n") -> list[tuple[int, int]]:
+    """Split buf into (at most) n byte ranges of about equal size, each ending right after a match of regex sep
+    (or at the end).
+
+    Records separated by sep (lines, blank line separated groups) never straddle two ranges.
+    """
+    view = memoryview(buf)
+    search = re.compile(sep).search
+    ranges = []
+    start = 0
+    for i in range(1, n):
+        m = search(view, max(start, len(view) * i // n))
+        if m is None:
+            break
+        ranges.append((start, m.end()))
+        start = m.end()
+    if start < len(view):
+        ranges.append((start, len(view)))
+    return ranges
+
+
+def split_windows(buf: Buffer, sep: bytes = b"\n") -> Iterator[bytes]:
+    """Copies of consecutive parts of buf of about WINDOW bytes, each ending right after a match of regex sep."""
+    view = memoryview(buf)
+    for start, end in chunk_ranges(view, len(view) // WINDOW + 1, sep):
+        yield bytes(view[start:end])
+
+
+def split_lines(buf: Buffer, strip: bool = True) -> Iterator[bytes]:
+    """Lines of buf without "\\n", by default also stripped of surrounding spaces, tabs and "\\r"."""
+    for window in split_windows(buf):
+        lines = window.split(b"\n")
+        if not lines[-1]:
+            lines.pop()  # window ends right after "\n"
+        yield from map(bytes.strip, lines, repeat(STRIPPED)) if strip else lines
+
+
+def split_blocks(buf: Buffer) -> Iterator[Buffer]:
+    """Blank line separated blocks (without the separating and trailing newlines), slices of buf."""
+    pos = 0
+    for m in re.finditer(BLANK_LINES, buf):
+        yield buf[pos:m.start()]
+        pos = m.end()
+    end = len(buf)
+    while end > pos and buf[end - 1] in b" \t\r\n":
+        end -= 1
+    if end > pos:
+        yield buf[pos:end]
+
+
+def windows(input_txt: str, sep: bytes = b"\n") -> Iterator[bytes]:
+    """Input in parts of about WINDOW bytes, no line (or other record ending with regex sep) is split between two."""
+    return split_windows(mapped(input_txt), sep)
+
+
+def lines(input_txt: str, strip: bool = True) -> Iterator[bytes]:
+    return split_lines(mapped(input_txt), strip)
+
+
+def blocks(input_txt: str) -> Iterator[memoryview]:
+    return split_blocks(mapped(input_txt))
+
+
+def ints(buf: Buffer, signed: bool = True) -> list[int]:
+    """All integers in buf, with signed=False "-" is a separator (e.g. of ranges "2-4")."""
+    return list(map(int, re.findall(INT if signed else UINT, buf)))
+
+
+def to_int(buf: Buffer) -> int:
+    return int(bytes(buf))
+
+
+def text(buf: Buffer) -> str:
+    return str(buf, "ascii")
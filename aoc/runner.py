@@ -0,0 +1,123 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+import argparse
+import io
+import os
+import time
+
+from aoc.days import DAYS, ROOT, Solver, cost_rank, discover, input_path
+from aoc.gen import generated_input
+from aoc.profiling import PROFILERS, profile_call
+from aoc.startup import print_report, profile_imports
+
+
+@dataclass
+class Result:
+    solver: Solver
+    answer: object
+    seconds: float
+    profile: str = ""  # top-N table, when profiled
+
+
+@dataclass(frozen=True)
+class ProfileOptions:
+    kind: str  # one of PROFILERS
+    out_dir: Path
+    top: int = 20
+
+
+def run_solver(solver: Solver, input_txt: str | Path, profile: ProfileOptions | None = None) -> Result:
+    # solvers print progress (and day10 prints its answer), keep workers' output from interleaving
+    out = io.StringIO()
+    table = ""
+    start = time.perf_counter()
+    with redirect_stdout(out):
+        if profile is None:
+            answer = solver.run(input_txt)
+        else:
+            stem = profile.out_dir / f"day{solver.day:02d}-{solver.part}"
+            answer, table = profile_call(profile.kind, stem, profile.top, solver.run, input_txt)
+    seconds = time.perf_counter() - start
+    if answer is None:
+        answer = "\n" + out.getvalue().rstrip()
+    return Result(solver, answer, seconds, table)
+
+
+def schedule(solvers: list[Solver]) -> list[Solver]:
+    # longest days first, so the whole run is bounded by the slowest day and not by the last one started
+    return sorted(solvers, key=lambda s: (cost_rank(s.day), s.day, s.part))
+
+
+def day_input(day: int, sample: bool = False, size: int | None = None, seed: int = 0) -> Path:
+    return generated_input(day, size, seed) if size else input_path(day, sample)
+
+
+def run_all(days: list[int], sample: bool = False, workers: int | None = None,
+            size: int | None = None, seed: int = 0, profile: ProfileOptions | None = None) -> list[Result]:
+    solvers = []
+    results = []
+    for d in days:
+        if not day_input(d, sample, size, seed).exists():
+            continue
+        try:
+            solvers += discover(d)
+        except ImportError as e:
+            results.append(Result(Solver(d, "import", ""), f"failed: {e!r}", 0.0))
+    solvers = schedule(solvers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_solver, s, day_input(s.day, sample, size, seed), profile): s for s in solvers}
+        for f in as_completed(futures):
+            if f.exception() is not None:
+                # one broken day should not hide answers of the others
+                results.append(Result(futures[f], f"failed: {f.exception()!r}", 0.0))
+            else:
+                results.append(f.result())
+    results.sort(key=lambda r: (r.solver.day, r.solver.part))
+    return results
+
+
+def print_results(results: list[Result]):
+    by_day = {}
+    for r in results:
+        by_day.setdefault(r.solver.day, []).append(r)
+    for day, rs in by_day.items():
+        print(f"day{day:02d} {sum(r.seconds for r in rs):8.3f}s")
+        for r in rs:
+            print(f"  {r.solver.part}: {r.answer} ({r.seconds:.3f}s)")
+            if r.profile:
+                print("    " + r.profile.strip().replace("\n", "\n    "))
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="aoc", description="Run solvers of all (or chosen) days.")
+    parser.add_argument("days", nargs="*", type=int, default=list(DAYS))
+    parser.add_argument("--sample", action="store_true", help="use sample.txt instead of puzzle input")
+    parser.add_argument("--size", type=int, help="use generated input of given size instead (see aoc.gen)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--fast-model", action="store_true", help="slots dataclasses instead of pydantic (see aoc.model)")
+    parser.add_argument("--import-times", action="store_true", help="only report cold start import costs")
+    parser.add_argument("--profile", choices=PROFILERS, help="profile solvers, write collapsed stacks")
+    parser.add_argument("--profile-dir", type=Path, default=ROOT / "profiles")
+    parser.add_argument("--top", type=int, default=20, help="length of hot function table when profiling")
+    parser.add_argument("--parse-cache", metavar="DIR", help="persist parsed inputs in DIR (see aoc.cache)")
+    args = parser.parse_args(argv)
+    if args.parse_cache:
+        os.environ["AOC_PARSE_CACHE_DIR"] = args.parse_cache  # inherited by workers
+    if args.fast_model:
+        os.environ["AOC_FAST_MODEL"] = "1"  # must be set before any day is imported
+    if args.import_times:
+        print_report([profile_imports(d) for d in args.days])
+        return
+
+    start = time.perf_counter()
+    profile = ProfileOptions(args.profile, args.profile_dir, args.top) if args.profile else None
+    results = run_all(args.days, args.sample, args.workers, args.size, args.seed, profile)
+    print_results(results)
+    print(f"total {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Cold start profile of solvers, aggregated -X importtime of a fresh interpreter importing dayNN.solve."""
+from dataclasses import dataclass, field
+import subprocess
+import sys
+import time
+
+from aoc.days import ROOT, module_name
+
+
+@dataclass
+class ImportProfile:
+    day: int
+    wall: float  # seconds, whole interpreter run (start, import, exit)
+    self_us: dict[str, int] = field(default_factory=dict)  # only modules not imported by bare interpreter
+    cumulative_us: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def solve_import_us(self) -> int:
+        return self.cumulative_us.get(module_name(self.day), 0)
+
+
+def importtime(code: str) -> tuple[float, dict[str, tuple[int, int]]]:
+    start = time.perf_counter()
+    p = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                       cwd=ROOT, capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+    modules = {}
+    for line in p.stderr.splitlines():
+        # import time:       238 |        238 |   day01
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return wall, modules
+
+
+def profile_imports(day: int, repeats: int = 3) -> ImportProfile:
+    _, bare = importtime("pass")
+    runs = [importtime(f"import {module_name(day)}") for _ in range(repeats)]
+    wall, modules = min(runs, key=lambda r: r[0])
+    res = ImportProfile(day, wall)
+    for name, (self_us, cumulative_us) in modules.items():
+        if name not in bare:
+            res.self_us[name] = self_us
+            res.cumulative_us[name] = cumulative_us
+    return res
+
+
+def print_report(profiles: list[ImportProfile], top: int = 5):
+    total_self = {}
+    importers = {}
+    for p in profiles:
+        heaviest = sorted(p.self_us.items(), key=lambda kv: -kv[1])[:top]
+        print(f"day{p.day:02d} cold start {p.wall * 1000:6.1f}ms  import {p.solve_import_us / 1000:6.1f}ms  "
+              + ", ".join(f"{name} {us / 1000:.1f}" for name, us in heaviest))
+        for name, us in p.self_us.items():
+            total_self[name] = total_self.get(name, 0) + us
+            importers[name] = importers.get(name, 0) + 1
+    print("\nheaviest modules over all days (self time summed, number of days importing it):")
+    for name, us in sorted(total_self.items(), key=lambda kv: -kv[1])[:top * 3]:
+        print(f"  {name:40} {us / 1000:8.1f}ms  {importers[name]:2} days")
@@ -1,33 +1,59 @@
-def part1(input_txt):
-    with open(input_txt) as f:
-        lines = map(lambda x: x.strip(), f.readlines())
-        best = 0
-        tmp = 0
-        for l in lines:
-            if l == '':
-                best = max(best, tmp)
-                tmp = 0
-            else:
-                tmp += int(l)
-        return best
-
-
-def part2(input_txt):
-    with open(input_txt) as f:
-        lines = map(lambda x: x.strip(), f.readlines())
-        s = []
-        tmp = 0
-        for l in lines:
-            if l == '':
-                s.append(tmp)
-                tmp = 0
-            else:
-                tmp += int(l)
-        return sum(sorted(s)[-3::])
+from collections.abc import Iterable, Iterator
+from itertools import chain, repeat
+import heapq
+import os
+
+from aoc import reader
+from aoc.lazy import lazy_import
+
+futures = lazy_import("concurrent.futures")
+
+PARALLEL_MIN_BYTES = 2 ** 26  # below that process startup costs more than parsing
+CHUNKS_PER_WORKER = 4  # a bit more chunks than workers evens out uneven chunks
+
+
+def group_totals(view: memoryview) -> Iterator[int]:
+    # windows end at blank lines (also "\r\n" ones), so no elf is split between two of them
+    for window in reader.split_windows(view, reader.BLANK_LINES):
+        for group in reader.split_blocks(window):
+            if calories := group.split():  # blank lines at the very start give an empty block
+                yield sum(map(int, calories))
+
+
+def top_k(totals: Iterable[int], k: int) -> list[int]:
+    # min-heap of k best so far, O(n log k) time, O(k) memory
+    heap = []
+    for t in totals:
+        if len(heap) < k:
+            heapq.heappush(heap, t)
+        elif t > heap[0]:
+            heapq.heapreplace(heap, t)
+    return sorted(heap, reverse=True)
+
+
+def range_top_k(input_txt: str, start: int, end: int, k: int) -> list[int]:
+    # every process maps the file on its own, only offsets and k results cross process boundary
+    return top_k(group_totals(reader.mapped(input_txt)[start:end]), k)
+
+
+def solve(input_txt: str, k: int = 3, workers: int | None = None) -> tuple[int, int]:
+    """workers=None: one process for small inputs, all cores for big ones."""
+    view = reader.mapped(input_txt)
+    if workers is None:
+        workers = os.cpu_count() if len(view) >= PARALLEL_MIN_BYTES else 1
+    # ranges end at blank lines, so an elf never straddles two of them and top-k of top-k's is exact
+    ranges = reader.chunk_ranges(view, workers * CHUNKS_PER_WORKER, reader.BLANK_LINES) if workers > 1 else []
+    if len(ranges) < 2:
+        best = top_k(group_totals(view), k)
+    else:
+        starts, ends = zip(*ranges)
+        with futures.ProcessPoolExecutor(workers) as pool:
+            partial = pool.map(range_top_k, repeat(input_txt), starts, ends, repeat(k))
+            best = top_k(chain.from_iterable(partial), k)
+    return best[0], sum(best)
 
 
 if __name__ == "__main__":
-    p1_ans = part1("part1.txt")
+    p1_ans, p2_ans = solve("part1.txt")
     print(f"part1: {p1_ans}")
-    p2_ans = part2("part1.txt")
     print(f"part2: {p2_ans}")
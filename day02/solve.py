@@ -1,3 +1,6 @@
+from aoc import reader
+
+
 def points1(p1: int, p2: int) -> int:
     p = p2 + 1
     if p1 == p2:
@@ -7,18 +10,6 @@ def points1(p1: int, p2: int) -> int:
     return p
 
 
-def part1(input_txt: str) -> int:
-    with open(input_txt) as f:
-        lines = map(lambda x: x.strip(), f.readlines())
-        res = 0
-        for line in lines:
-            a, b = line.split()
-            p1 = ord(a) - ord('A')
-            p2 = ord(b) - ord('X')
-            res += points1(p1, p2)
-        return res
-
-
 def points2(p1: int, r: int) -> int:
     p = r * 3
     match r:
@@ -31,20 +22,30 @@ def points2(p1: int, r: int) -> int:
     return p
 
 
-def part2(input_txt: str) -> int:
-    with open(input_txt) as f:
-        lines = map(lambda x: x.strip(), f.readlines())
-        res = 0
-        for line in lines:
-            a, b = line.split()
-            p1 = ord(a) - ord('A')
-            r = ord(b) - ord('X')
-            res += points2(p1, r)
-        return res
+# score tables, [opponent's shape][second column]
+SCORES1 = [[points1(p1, p2) for p2 in range(3)] for p1 in range(3)]
+SCORES2 = [[points2(p1, r) for r in range(3)] for p1 in range(3)]
+
+# there are only 9 distinct lines, count them with bytes.count instead of looking at every line
+LINES = {(p1, col): f"{'ABC'[p1]} {'XYZ'[col]}".encode() for p1 in range(3) for col in range(3)}
+
+
+def count_lines(input_txt: str) -> dict[tuple[int, int], int]:
+    counts = dict.fromkeys(LINES, 0)
+    for window in reader.windows(input_txt):
+        for key, line in LINES.items():
+            counts[key] += window.count(line)
+    return counts
+
+
+def solve(input_txt: str) -> tuple[int, int]:
+    counts = count_lines(input_txt)
+    p1_ans = sum(n * SCORES1[p1][col] for (p1, col), n in counts.items())
+    p2_ans = sum(n * SCORES2[p1][col] for (p1, col), n in counts.items())
+    return p1_ans, p2_ans
 
 
 if __name__ == "__main__":
-    p1_ans = part1("part1.txt")
+    p1_ans, p2_ans = solve("part1.txt")
     print(f"part1: {p1_ans}")
-    p2_ans = part2("part1.txt")
     print(f"part2: {p2_ans}")
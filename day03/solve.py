@@ -1,35 +1,45 @@
-from string import ascii_letters
-
-
-def priority(c: str) -> int:
-    return ascii_letters.index(c) + 1
-
-
-def part1(input_txt: str) -> int:
-    with open(input_txt) as f:
-        lines = map(lambda x: x.strip(), f.readlines())
-        res = 0
-        for line in lines:
-            half = len(line) // 2
-            a, b = set(line[:half]), set(line[half:])
-            common = a & b
-            res += priority(common.pop())
-        return res
-
-
-def part2(input_txt: str) -> int:
-    with open(input_txt) as f:
-        lines = list(map(lambda x: x.strip(), f.readlines()))
-        res = 0
-        for i in range(len(lines) // 3):
-            a, b, c = set(lines[i * 3]), set(lines[i * 3 + 1]), set(lines[i * 3 + 2])
-            common = a & b & c
-            res += priority(common.pop())
-        return res
+from aoc import reader
+
+LETTERS = bytes(range(ord('a'), ord('z') + 1)) + bytes(range(ord('A'), ord('Z') + 1))
+# item byte -> its priority: a..z have priorities 1..26, A..Z 27..52
+PRIORITY = bytes.maketrans(LETTERS, bytes(range(1, 53)))
+BIT = [1 << p for p in range(256)]
+
+
+def item_mask(priorities: bytes) -> int:
+    # set of items as 52-bit mask, bit p is set when item of priority p is there
+    # (plain loop, on 3.11 it is about twice as fast as functools.reduce)
+    mask = 0
+    for p in priorities:
+        mask |= BIT[p]
+    return mask
+
+
+def priority(mask: int) -> int:
+    # mask of exactly one item
+    return mask.bit_length() - 1
+
+
+def solve(input_txt: str) -> tuple[int, int]:
+    p1_ans = p2_ans = 0
+    badge = -1  # all bits, intersection of rucksacks of the current group so far
+    in_group = 0
+    for window in reader.windows(input_txt):
+        for line in window.split():
+            items = line.translate(PRIORITY)
+            half = len(items) // 2
+            a, b = item_mask(items[:half]), item_mask(items[half:])
+            p1_ans += priority(a & b)
+            badge &= a | b
+            in_group += 1
+            if in_group == 3:
+                p2_ans += priority(badge)
+                badge = -1
+                in_group = 0
+    return p1_ans, p2_ans
 
 
 if __name__ == "__main__":
-    p1_ans = part1("part1.txt")
+    p1_ans, p2_ans = solve("part1.txt")
     print(f"part1: {p1_ans}")
-    p2_ans = part2("part1.txt")
     print(f"part2: {p2_ans}")
@@ -1,46 +1,69 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from operator import and_, le, or_
 from typing import Self
-from pydantic.dataclasses import dataclass
 
+from aoc import reader
 
-@dataclass(frozen=True)
-class Range:
-    left: int
-    right: int
+Columns = tuple[list[int], list[int], list[int], list[int]]
 
-    def contains_fully(self, other: Self) -> bool:
-        return self.left <= other.left and other.right <= self.right
 
-    def overlaps(self, other: Self) -> bool:
-        return self.left <= other.right and other.left <= self.right
+def columns(input_txt: str) -> Iterator[Columns]:
+    """Left and right ends of first and second ranges of all pairs, window by window."""
+    for window in reader.windows(input_txt):
+        nums = reader.ints(window, signed=False)
+        yield nums[0::4], nums[1::4], nums[2::4], nums[3::4]
+
+
+def solve(input_txt: str) -> tuple[int, int]:
+    contained = overlapping = 0
+    for l1, r1, l2, r2 in columns(input_txt):
+        # element-wise comparisons of whole columns, map over C functions runs no Python code per pair
+        contained += sum(map(or_, map(and_, map(le, l1, l2), map(le, r2, r1)),
+                             map(and_, map(le, l2, l1), map(le, r1, r2))))
+        overlapping += sum(map(and_, map(le, l1, r2), map(le, l2, r1)))
+    return contained, overlapping
 
-    @classmethod
-    def from_str(cls, s: str) -> Self:
-        # conversion to int not necessary here (pydantic will do that)
-        return cls(*map(int, s.split("-")))
 
+class OverlapIndex:
+    """Overlaps among all assignments of the file (not only within pairs), O(n log n) build, O(log n) queries."""
 
-def part1(input_txt: str) -> int:
-    with open(input_txt) as f:
-        lines = map(lambda x: x.strip(), f.readlines())
-        res = 0
-        for line in lines:
-            a, b = map(Range.from_str, line.split(","))
-            res += int(a.contains_fully(b) or b.contains_fully(a))
-        return res
+    def __init__(self, starts: Iterable[int], ends: Iterable[int]):
+        # left and right ends of all assignments, in any order
+        self.starts = sorted(starts)
+        self.ends = sorted(ends)
+        self.overlapping_pairs = self._sweep()
+
+    @classmethod
+    def from_input(cls, input_txt: str) -> Self:
+        starts, ends = [], []
+        for l1, r1, l2, r2 in columns(input_txt):
+            starts += l1
+            starts += l2
+            ends += r1
+            ends += r2
+        return cls(starts, ends)
 
+    def _sweep(self) -> int:
+        # visit starts in order; ranges which ended before current start cannot overlap it,
+        # all other already started ones do, so every overlapping pair is counted once, at its later start
+        pairs = 0
+        ended = 0
+        for started_before, s in enumerate(self.starts):
+            while self.ends[ended] < s:
+                ended += 1
+            pairs += started_before - ended
+        return pairs
 
-def part2(input_txt: str) -> int:
-    with open(input_txt) as f:
-        lines = map(lambda x: x.strip(), f.readlines())
-        res = 0
-        for line in lines:
-            a, b = map(Range.from_str, line.split(","))
-            res += int(a.overlaps(b))
-        return res
+    def count_overlapping(self, left: int, right: int) -> int:
+        """Number of assignments overlapping sections [left, right]."""
+        # all but those starting after right and those ending before left (no range is both)
+        starting_after = len(self.starts) - bisect_right(self.starts, right)
+        ending_before = bisect_left(self.ends, left)
+        return len(self.starts) - starting_after - ending_before
 
 
 if __name__ == "__main__":
-    p1_ans = part1("part1.txt")
+    p1_ans, p2_ans = solve("part1.txt")
     print(f"part1: {p1_ans}")
-    p2_ans = part2("part1.txt")
     print(f"part2: {p2_ans}")
@@ -1,91 +1,78 @@
-from typing import Self
-from dataclasses import field
-from pydantic.dataclasses import dataclass
-from collections import deque
-from collections.abc import Iterator
-import re
-
-
-@dataclass
-class Stack:
-    value: deque[str] = field(default_factory=lambda: deque())
-
-    def pop(self, count: int) -> Iterator[str]:
-        for _ in range(count):
-            yield self.value.pop()
-
-    def pop_and_reverse(self, count: int) -> list[str]:
-        ret = []
-        for _ in range(count):
-            ret.append(self.value.pop())
-        return ret[::-1]
-
-    def put(self, elem: str) -> None:
-        self.value.append(elem)
-
-    def peek(self) -> str:
-        return self.value[-1]
-
-    @classmethod
-    def from_str(cls, s: str) -> Self:
-        return cls(value=deque(s))
-
-
-@dataclass
-class Move:
-    src: int
-    dst: int
-    count: int
-
-    @classmethod
-    def from_str(cls, s: str) -> Self:
-        c, src, dst = map(int, re.findall(r"\d+", s))
-        return cls(src=src - 1, dst=dst - 1, count=c)
-
-
-def rotate_right(lines: list[str]) -> list[str]:
-    len_y = len(lines)
-    len_x = len(lines[0])
-    rotated = [['' for _ in range(len_y)] for _ in range(len_x)]
-    for i in range(len_x):
-        for j in range(len_y):
-            rotated[i][len_y - j - 1] = lines[j][i]
-    res = ["".join(l) for l in rotated]
-    return res
-
-
-def extract_stack_lines(stacks_str: str) -> Iterator[str]:
-    lines = stacks_str.split("\n")[:-1]  # get rid of last line with numbers
-    rotated = rotate_right(lines)
-    for l in rotated:
-        l = l.strip()
-        if l.isalpha():
-            yield l
-
-
-def parse_stacks_and_moves(s):
-    stacks_str, moves_str = s.read().split("\n\n")
-    stacks = list(map(Stack.from_str, extract_stack_lines(stacks_str)))
-    moves = map(Move.from_str, moves_str.split("\n"))
-    return stacks, moves
+from aoc import reader
+
+Move = tuple[int, int, int]  # count, src, dst (stacks numbered from 0)
+
+
+def parse_stacks(stacks_str: str) -> list[list[str]]:
+    *rows, numbers = stacks_str.split("\n")
+    stacks = [[] for _ in numbers.split()]
+    for row in reversed(rows):
+        # crate of stack i is in column 4 * i + 1, short rows just have no crates on the right
+        for stack, crate in zip(stacks, row[1::4]):
+            if crate != " ":
+                stack.append(crate)
+    return stacks
+
+
+def parse_stacks_and_moves(input_txt: str) -> tuple[list[list[str]], list[Move]]:
+    stacks_block, moves_block = reader.blocks(input_txt)
+    nums = reader.ints(moves_block)
+    moves = list(zip(nums[0::3], [src - 1 for src in nums[1::3]], [dst - 1 for dst in nums[2::3]]))
+    return parse_stacks(reader.text(stacks_block)), moves
+
+
+def crane(stacks: list[list[str]], moves: list[Move], reverse: bool) -> str:
+    # whole slice moves at once; CrateMover 9000 moves crates one by one, so they end up reversed
+    for count, src, dst in moves:
+        s = stacks[src]
+        cut = len(s) - count
+        crates = s[cut:]
+        del s[cut:]
+        stacks[dst] += crates[::-1] if reverse else crates
+    return "".join([s[-1] for s in stacks if s])
+
+
+def trace_tops(stacks: list[list[str]], moves: list[Move], reverse: bool) -> str:
+    """Same answer as crane(), but only the final top crates are followed, backwards through the moves.
+
+    O(moves * stacks), no matter how many crates there are and how many of them every move takes.
+    """
+    heights = [len(s) for s in stacks]
+    for count, src, dst in moves:
+        heights[src] -= count
+        heights[dst] += count
+    # (stack, depth from the top) of every reported crate
+    tracked = [(i, 0) for i, h in enumerate(heights) if h]
+    for count, src, dst in reversed(moves):
+        for t, (stack, depth) in enumerate(tracked):
+            if depth < count and stack == dst:
+                # moved by this move, undo it (reversed slice is mirrored)
+                tracked[t] = src, count - 1 - depth if reverse else depth
+            elif src == dst:
+                pass
+            elif stack == dst:
+                tracked[t] = stack, depth - count
+            elif stack == src:
+                tracked[t] = stack, depth + count
+    return "".join([stacks[stack][-1 - depth] for stack, depth in tracked])
+
+
+def solve_moves(stacks: list[list[str]], moves: list[Move], reverse: bool) -> str:
+    # both engines give the same answer, pick the one with less work
+    moved_crates = sum(count for count, _, _ in moves)
+    if moved_crates > len(moves) * len(stacks):
+        return trace_tops(stacks, moves, reverse)
+    return crane(stacks, moves, reverse)
 
 
 def part1(input_txt: str) -> str:
-    with open(input_txt) as f:
-        stacks, moves = parse_stacks_and_moves(f)
-        for m in moves:
-            for e in stacks[m.src].pop(m.count):
-                stacks[m.dst].put(e)
-        return "".join([s.peek() for s in stacks])
+    stacks, moves = parse_stacks_and_moves(input_txt)
+    return solve_moves(stacks, moves, reverse=True)
 
 
 def part2(input_txt: str) -> str:
-    with open(input_txt) as f:
-        stacks, moves = parse_stacks_and_moves(f)
-        for m in moves:
-            for e in stacks[m.src].pop_and_reverse(m.count):
-                stacks[m.dst].put(e)
-        return "".join([s.peek() for s in stacks])
+    stacks, moves = parse_stacks_and_moves(input_txt)
+    return solve_moves(stacks, moves, reverse=False)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,80 @@
-def solve(input_txt: str, n: int) -> int:
-    with open(input_txt) as f:
-        s = f.read()
-        for i in range(n, len(s)):
-            if len(set(s[i - n:i])) == n:
-                return i
+from collections.abc import Callable, Iterable
+
+CHUNK = 2 ** 16
+
+
+class Window:
+    # plain class, dataclasses would pull inspect and ast into the start of this day
+    __slots__ = ("n", "counts", "distinct")
+
+    def __init__(self, n: int):
+        self.n = n
+        self.counts = [0] * 256  # of bytes in the last n
+        self.distinct = 0
+
+    def feed(self, data: bytes, start: int) -> int | None:
+        """Slide over data[start:], return index just after the first marker, if any.
+
+        data[:start] are bytes fed before (at least n of them, unless the stream is that short).
+        """
+        n = self.n
+        counts = self.counts
+        distinct = self.distinct
+        res = None
+        for i in range(start, len(data)):
+            b = data[i]
+            counts[b] += 1
+            if counts[b] == 1:
+                distinct += 1
+            if i >= n:
+                out = data[i - n]
+                counts[out] -= 1
+                if counts[out] == 0:
+                    distinct -= 1
+            if distinct == n:
+                res = i + 1
+                break
+        self.distinct = distinct
+        return res
+
+
+def find_markers(read: Callable[[int], bytes], sizes: Iterable[int]) -> dict[int, int | None]:
+    """For every n of sizes, number of bytes read when the last n were all different.
+
+    One pass over the stream for any number of sizes, read(CHUNK) (file.read, socket.recv, ...) is called
+    until all markers are found or the signal ends (newline or end of stream). Memory is O(CHUNK).
+    """
+    windows = [Window(n) for n in set(sizes)]
+    markers = {w.n: None for w in windows}
+    keep = max(markers, default=0)
+    tail = b""  # last bytes of previous chunks, they still have to leave windows
+    seen = 0  # bytes of the signal before data
+    while windows:
+        chunk = read(CHUNK)
+        end = chunk.find(b"\n")
+        data = tail + (chunk if end == -1 else chunk[:end])
+        base = seen - len(tail)  # stream position of data[0]
+        for w in list(windows):
+            i = w.feed(data, len(tail))
+            if i is not None:
+                markers[w.n] = base + i
+                windows.remove(w)
+        if not chunk or end != -1:
+            break
+        seen += len(data) - len(tail)
+        tail = data[-keep:]
+    return markers
+
+
+def solve(input_txt: str, sizes: tuple[int, ...] = (4, 14)) -> tuple[int | None, ...]:
+    with open(input_txt, "rb") as f:
+        markers = find_markers(f.read, sizes)
+    return tuple(markers[n] for n in sizes)
 
 
 if __name__ == "__main__":
-    sample_ans = solve("sample.txt", 4)
-    assert sample_ans == 5
-    p1_ans = solve("input.txt", 4)
+    sample_ans = solve("sample.txt")
+    assert sample_ans == (5, 23)
+    p1_ans, p2_ans = solve("input.txt")
     assert p1_ans == 1987
-    p2_ans = solve("input.txt", 14)
     assert p2_ans == 3059
@@ -1,74 +1,86 @@
-from typing import Self, Callable
-from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Self, Iterable
+from dataclasses import dataclass
 
+from aoc import reader
+from aoc.cache import parse_cache
 
-@dataclass
-class Node:
-    name: str
-    size: int | None = None
-    parent: Self | None = None
-    subdirs: dict[str, Self] = field(default_factory=dict)
-    files: list[Self] = field(default_factory=list)
-    cached_total_size: int | None = None  # not necessary, but helpful when visiting multiple times
-
-    def total_size(self) -> int:
-        if self.cached_total_size:
-            return self.cached_total_size
-        files_size = sum([f.size for f in self.files])
-        subdirs_size = sum([d.total_size() for d in self.subdirs.values()])
-        self.cached_total_size = files_size + subdirs_size
-        return self.cached_total_size
-
-
-def find_dirs(n: Node, p: Callable[[Node], bool]) -> list[Node]:
-    res = []
-    if p(n):
-        res.append(n)
-    for s in n.subdirs.values():
-        res += find_dirs(s, p)
-    return res
-
-
-def parse_tree(input_txt: str) -> Node:
-    with open(input_txt) as f:
-        root = Node(name="/")
-        c = root
-        for line in f:
-            tokens = line.split()
-            match tokens:
-                case ["$", "cd", "/"]:
-                    c = root
-                case ["$", "cd", ".."]:
-                    c = c.parent
-                case ["$", "cd", dir_name]:
-                    c = c.subdirs[dir_name]
-                case ["$", "ls"]:
-                    pass
-                case ["dir", dir_name]:
-                    d = Node(name=dir_name, parent=c)
-                    c.subdirs[dir_name] = d
-                case [file_size, file_name]:
-                    f = Node(name=file_name, size=int(file_size), parent=c)
-                    c.files.append(f)
+
+def parse_dir_sizes(input_txt: str) -> list[int]:
+    """Total sizes of all directories, straight from the log, without building the tree.
+
+    Only running totals of the directories on the current path are kept; a directory's total is final
+    (and added to its parent) when it is left. Assumes every directory is listed once, as AoC logs do.
+    """
+    sizes = []
+    path = [0]  # running totals, root first
+
+    def leave():
+        size = path.pop()
+        sizes.append(size)
+        path[-1] += size
+
+    for line in reader.lines(input_txt):
+        if line[:4] == b"$ cd":
+            match bytes(line[5:]):
+                case b"/":
+                    while len(path) > 1:
+                        leave()
+                case b"..":
+                    leave()
                 case _:
-                    raise Exception("should not happen!")
-        return root
+                    path.append(0)
+        elif line[:1] != b"$" and line[:4] != b"dir ":
+            path[-1] += int(bytes(line).split(maxsplit=1)[0])
+    while len(path) > 1:
+        leave()
+    sizes.append(path[0])  # root
+    return sizes
+
+
+@dataclass
+class DirSizeIndex:
+    """Threshold queries over directory sizes of one filesystem, O(log n) each (k largest: O(log n + k))."""
+    sizes: list[int]  # sorted
+    prefix_sums: list[int]  # prefix_sums[i] == sum(sizes[:i])
+
+    @classmethod
+    def from_sizes(cls, sizes: Iterable[int]) -> Self:
+        sizes = sorted(sizes)
+        return cls(sizes, list(accumulate(sizes, initial=0)))
+
+    @property
+    def used(self) -> int:
+        return self.sizes[-1] if self.sizes else 0  # root contains everything
+
+    def sum_at_most(self, x: int) -> int:
+        return self.prefix_sums[bisect_right(self.sizes, x)]
+
+    def smallest_at_least(self, y: int) -> int | None:
+        i = bisect_left(self.sizes, y)
+        return self.sizes[i] if i < len(self.sizes) else None
+
+    def largest(self, k: int) -> list[int]:
+        return self.sizes[:-k - 1:-1] if k > 0 else []
+
+
+@parse_cache(shared=True)
+def size_index(input_txt: str) -> DirSizeIndex:
+    return DirSizeIndex.from_sizes(parse_dir_sizes(input_txt))
 
 
 def part1(input_txt: str) -> int:
-    root = parse_tree(input_txt)
-    interesting_dirs = find_dirs(root, lambda n: n.total_size() <= 100_000)
-    return sum([d.total_size() for d in interesting_dirs])
+    return size_index(input_txt).sum_at_most(100_000)
 
 
 def part2(input_txt: str) -> int:
-    root = parse_tree(input_txt)
+    index = size_index(input_txt)
     disk_size = 70_000_000
     need_space = 30_000_000
-    unused_space = disk_size - root.total_size()
+    unused_space = disk_size - index.used
     min_to_remove = need_space - unused_space
-    dirs_to_delete = find_dirs(root, lambda n: n.total_size() >= min_to_remove)
-    return min([d.total_size() for d in dirs_to_delete])
+    return index.smallest_at_least(min_to_remove)
 
 
 if __name__ == "__main__":
@@ -1,59 +1,134 @@
-DIRS = [(0, 1), (1, 0), (-1, 0), (0, -1)]
-
-
-def parse_matrix(input_txt: str) -> (list[list[int]], int, int):
-    with open(input_txt) as f:
-        lines = map(lambda x: x.strip(), f.readlines())
-        matrix = [[int(c) for c in line] for line in lines]
-        return matrix, len(matrix), len(matrix[0])  # matrix, cols, rows
-
-
-def part1(input_txt: str) -> int:
-    matrix, num_cols, num_rows = parse_matrix(input_txt)
-    res = 0
-    for col in range(num_cols):
-        for row in range(num_rows):
-            v = matrix[col][row]
-            for d in DIRS:
-                vis = True
-                col_n = col + d[0]
-                row_n = row + d[1]
-                while 0 <= col_n < num_cols and 0 <= row_n < num_rows:
-                    if matrix[col_n][row_n] >= v:
-                        vis = False
-                        break
-                    col_n += d[0]
-                    row_n += d[1]
-                if vis:
-                    res += 1
-                    break
-    return res
-
-
-def part2(input_txt: str) -> int:
-    matrix, num_cols, num_rows = parse_matrix(input_txt)
-    best = 0
-    for col in range(num_cols):
-        for row in range(num_rows):
-            v = matrix[col][row]
-            res = 1
-            for d in DIRS:
-                e = 0
-                col_n = col + d[0]
-                row_n = row + d[1]
-                while 0 <= col_n < num_cols and 0 <= row_n < num_rows:
-                    e += 1
-                    if matrix[col_n][row_n] >= v:
-                        break
-                    col_n += d[0]
-                    row_n += d[1]
-                res *= e
-            best = max(best, res)
-    return best
+from array import array
+from itertools import repeat
+from operator import mul, or_
+import os
+
+from aoc import reader
+from aoc.cache import parse_cache
+from aoc.lazy import lazy_import
+
+futures = lazy_import("concurrent.futures")
+shared_memory = lazy_import("multiprocessing.shared_memory")
+
+PARALLEL_MIN_TREES = 2 ** 20  # below that process startup costs more than sweeping
+BANDS_PER_WORKER = 4  # a bit more bands than workers evens out the load
+
+
+@parse_cache(shared=True)
+def parse_forest(input_txt: str) -> tuple[bytes, int]:
+    # heights stay ASCII digits, they compare the same way as the numbers
+    rows = list(reader.lines(input_txt))
+    return b"".join(rows), len(rows[0])  # row-major heights, width
+
+
+def look_back(line: bytes) -> tuple[bytearray, list[int]]:
+    """For every tree of the line: is it visible from the start, how many trees it sees towards the start."""
+    visible = bytearray(len(line))
+    dist = [0] * len(line)
+    stack = []  # positions of trees not hidden behind a later one at least as tall, so heights never grow
+    for j, h in enumerate(line):
+        while stack and line[stack[-1]] < h:
+            stack.pop()
+        if stack:
+            dist[j] = j - stack[-1]  # view stops at the first tree at least as tall
+        else:
+            visible[j] = 1  # all trees before are lower
+            dist[j] = j
+        stack.append(j)
+    return visible, dist
+
+
+def sweep(line: bytes) -> tuple[bytes, list[int]]:
+    """Visible from either end of the line, product of viewing distances towards both ends."""
+    vis_fwd, dist_fwd = look_back(line)
+    vis_bwd, dist_bwd = look_back(line[::-1])
+    return bytes(map(or_, vis_fwd, reversed(vis_bwd))), list(map(mul, dist_fwd, reversed(dist_bwd)))
+
+
+def sweep_rows(heights: memoryview | bytes, width: int, visible: memoryview | bytearray, score: memoryview | array,
+               rows: range):
+    for r in rows:
+        cells = slice(r * width, (r + 1) * width)
+        visible[cells], s = sweep(heights[cells])
+        score[cells] = array("q", s)
+
+
+def sweep_cols(heights: memoryview | bytes, width: int, visible: memoryview | bytearray, score: memoryview | array,
+               cols: range):
+    # combines with what sweep_rows left for the same cells
+    for c in cols:
+        cells = slice(c, None, width)
+        v, s = sweep(heights[cells])
+        visible[cells] = bytes(map(or_, visible[cells], v))
+        score[cells] = array("q", map(mul, score[cells], s))
+
+
+def bands(count: int, n: int) -> list[range]:
+    return [r for i in range(n) if (r := range(count * i // n, count * (i + 1) // n))]
+
+
+def score_offset(trees: int) -> int:
+    # shared buffer: heights, visible flags, then 8-byte aligned scores
+    return -(-2 * trees // 8) * 8
+
+
+def sweep_band(name: str, trees: int, width: int, rows: range | None, cols: range | None) -> tuple[int, int]:
+    """Sweep a band of whole rows or whole columns of the forest in shared memory named name.
+
+    Bands never split a row or a column, so no stack or maximum has to cross bands; after the column pass
+    cells of the band's columns are final and the band reports just its (visible count, best score).
+    """
+    shm = shared_memory.SharedMemory(name)
+    at = score_offset(trees)
+    heights, visible, score = shm.buf[:trees], shm.buf[trees:2 * trees], shm.buf[at:at + 8 * trees].cast("q")
+    try:
+        if rows is not None:
+            sweep_rows(heights, width, visible, score, rows)
+            return 0, 0
+        sweep_cols(heights, width, visible, score, cols)
+        return (sum(bytes(visible[c::width]).count(1) for c in cols),
+                max(max(score[c::width]) for c in cols))
+    finally:
+        for view in (heights, visible, score):
+            view.release()
+        shm.close()
+
+
+def solve_parallel(heights: bytes, width: int, workers: int) -> tuple[int, int]:
+    trees = len(heights)
+    at = score_offset(trees)
+    shm = shared_memory.SharedMemory(create=True, size=at + 8 * trees)
+    try:
+        shm.buf[:trees] = heights
+        names, sizes, widths = repeat(shm.name), repeat(trees), repeat(width)
+        with futures.ProcessPoolExecutor(workers) as pool:
+            # columns combine with the results of rows, so all row bands must be done first
+            list(pool.map(sweep_band, names, sizes, widths, bands(trees // width, workers * BANDS_PER_WORKER),
+                          repeat(None)))
+            summaries = list(pool.map(sweep_band, names, sizes, widths, repeat(None),
+                                      bands(width, workers * BANDS_PER_WORKER)))
+    finally:
+        shm.close()
+        shm.unlink()
+    return sum(v for v, _ in summaries), max(s for _, s in summaries)
+
+
+def solve(input_txt: str, workers: int | None = None) -> tuple[int, int]:
+    """workers=None: one process for small forests, all cores for big ones."""
+    # O(rows * cols): every row and column is swept twice with a monotonic stack
+    heights, width = parse_forest(input_txt)
+    if workers is None:
+        workers = os.cpu_count() if len(heights) >= PARALLEL_MIN_TREES else 1
+    if workers > 1:
+        return solve_parallel(heights, width, workers)
+    visible = bytearray(len(heights))
+    score = array("q", bytes(8 * len(heights)))
+    sweep_rows(heights, width, visible, score, range(len(heights) // width))
+    sweep_cols(heights, width, visible, score, range(width))
+    return visible.count(1), max(score)
 
 
 if __name__ == "__main__":
-    p1_ans = part1("input.txt")
+    p1_ans, p2_ans = solve("input.txt")
     print(f"part1: {p1_ans}")
-    p2_ans = part2("input.txt")
     print(f"part2: {p2_ans}")
@@ -1,4 +1,9 @@
-from pydantic.dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterable
+from math import inf
+
+from aoc import reader
 
 DIRS = {
     "R": (1, 0),
@@ -7,63 +12,338 @@ DIRS = {
     "D": (0, -1)
 }
 
+Step = tuple[int, int]
+Run = tuple[tuple[Step, ...], int]  # pattern of single steps of a knot, repeated that many times
+
+STAY = 0, 0
+MAX_PERIOD = 8  # longest pattern of steps folded into a run
+STEP_MAX = 64  # shorter moves are simulated step by step, folding runs costs more there (2 to 100 knots)
+
+WORD = 64  # cells of a row per bitset word
+
+
+class VisitedCells:
+    """Set of cells kept as a sparse bitset of single cells plus straight lines, so a long line costs the same
+    as a short one.
+
+    Memory is O(words of single cells + lines), no matter how far apart they are; len() unions them all:
+    lines by a sweep, single cells by masking out the lines of their row and the columns of their word.
+    """
+
+    def __init__(self):
+        self.words = {}  # (y, x // WORD) -> bit x % WORD set for every single cell
+        self.rows = defaultdict(list)  # y -> [(x1, x2), ...] horizontal lines
+        self.cols = defaultdict(list)  # x -> [(y1, y2), ...] vertical lines
+
+    def add(self, x: int, y: int):
+        key = y, x // WORD
+        self.words[key] = self.words.get(key, 0) | 1 << x % WORD
+
+    def add_line(self, x: int, y: int, dx: int, dy: int, count: int):
+        """Add count cells going straight from (x, y) (excluded) in direction (dx, dy).
+
+        Diagonal lines are added cell by cell, they are only as long as the bend of rope they come from.
+        """
+        if count <= 0:
+            return
+        ex, ey = x + dx * count, y + dy * count
+        if dy == 0:
+            self.rows[y].append((min(x + dx, ex), max(x + dx, ex)))
+        elif dx == 0:
+            self.cols[x].append((min(y + dy, ey), max(y + dy, ey)))
+        else:
+            for t in range(1, count + 1):
+                self.add(x + dx * t, y + dy * t)
+
+    def __len__(self) -> int:
+        rows = {y: merge(spans) for y, spans in self.rows.items()}
+        cols = {x: merge(spans) for x, spans in self.cols.items()}
+        on_lines = (sum(x2 - x1 + 1 for spans in rows.values() for x1, x2 in spans)
+                    + sum(y2 - y1 + 1 for spans in cols.values() for y1, y2 in spans)
+                    - crossings(rows, cols))
+        col_xs = sorted(cols)
+        single = 0
+        for (y, w), bits in self.words.items():
+            lo = w * WORD
+            hi = lo + WORD - 1
+            spans = rows.get(y, ())
+            for i in range(max(bisect_right(spans, (lo, inf)) - 1, 0), len(spans)):
+                x1, x2 = spans[i]
+                if x1 > hi:
+                    break
+                if x2 >= lo:
+                    bits &= ~((1 << min(x2, hi) - lo + 1) - (1 << max(x1, lo) - lo))
+            for x in col_xs[bisect_left(col_xs, lo):bisect_right(col_xs, hi)]:
+                if covers(cols[x], y):
+                    bits &= ~(1 << x - lo)
+            single += bits.bit_count()
+        return on_lines + single
+
+
+def merge(spans: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Disjoint spans covering the same integers as spans."""
+    spans.sort()
+    merged = [spans[0]]
+    for lo, hi in spans[1:]:
+        last_lo, last_hi = merged[-1]
+        if lo <= last_hi + 1:
+            merged[-1] = last_lo, max(last_hi, hi)
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+def covers(spans: list[tuple[int, int]] | None, v: int) -> bool:
+    if not spans:
+        return False
+    i = bisect_right(spans, (v, inf)) - 1
+    return i >= 0 and spans[i][1] >= v
+
+
+def crossings(rows: dict[int, list[tuple[int, int]]], cols: dict[int, list[tuple[int, int]]]) -> int:
+    """Cells in both a row span and a column span (spans of each row and of each column are disjoint).
+
+    Sweep over x: a Fenwick tree over row numbers counts rows whose span covers the current x.
+    """
+    ys = sorted(rows)
+    tree = [0] * (len(ys) + 1)
+
+    def update(i: int, delta: int):
+        i += 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def covered(y_end: int) -> int:
+        # rows below y_end covering x
+        i = bisect_left(ys, y_end)
+        n = 0
+        while i:
+            n += tree[i]
+            i &= i - 1
+        return n
+
+    # (x, order, ...): rows start/end before columns at the same x are asked
+    events = []
+    for j, y in enumerate(ys):
+        for x1, x2 in rows[y]:
+            events.append((x1, 0, j, 1))
+            events.append((x2 + 1, 0, j, -1))
+    for x, spans in cols.items():
+        for y1, y2 in spans:
+            events.append((x, 1, y1, y2))
+    events.sort()
+    n = 0
+    for _, order, a, b in events:
+        if order == 0:
+            update(a, b)
+        else:
+            n += covered(b + 1) - covered(a)
+    return n
+
+
+def sign(v: int) -> int:
+    return (v > 0) - (v < 0)
+
+
+class Path:
+    """Steps of one knot during one head move, repeated patterns folded into runs as they come."""
+
+    def __init__(self):
+        self.runs = []  # [pattern, repeats]
+        self.pending = []  # latest single steps, not in runs yet
+
+    def _flush(self, n: int):
+        for s in self.pending[:n]:
+            if self.runs and self.runs[-1][0] == (s,):
+                self.runs[-1][1] += 1
+            else:
+                self.runs.append([(s,), 1])
+        del self.pending[:n]
+
+    def step(self, s: Step):
+        pending = self.pending
+        pending.append(s)
+        if self.runs and tuple(pending) == self.runs[-1][0]:
+            self.runs[-1][1] += 1
+            pending.clear()
+            return
+        for p in range(1, min(len(pending) // 2, MAX_PERIOD) + 1):
+            if pending[-p:] == pending[-2 * p:-p]:
+                self._flush(len(pending) - 2 * p)
+                self.runs.append([tuple(pending[-p:]), 2])
+                pending.clear()
+                return
+        if len(pending) > 2 * MAX_PERIOD:
+            self._flush(1)
+
+    def repeat(self, pattern: tuple[Step, ...], times: int):
+        if len(pattern) * times <= MAX_PERIOD:
+            for _ in range(times):
+                for s in pattern:
+                    self.step(s)  # short ones may still be part of a longer pattern
+            return
+        pending = self.pending
+        while len(pending) >= len(pattern) and tuple(pending[-len(pattern):]) == pattern:
+            del pending[-len(pattern):]
+            times += 1
+        self._flush(len(pending))
+        if self.runs and self.runs[-1][0] == pattern:
+            self.runs[-1][1] += times
+        else:
+            self.runs.append([pattern, times])
+
+    def finish(self) -> list[Run]:
+        self._flush(len(self.pending))
+        return [(pattern, times) for pattern, times in self.runs]
+
+
+def shift(pattern: tuple[Step, ...]) -> Step:
+    return sum(dx for dx, _ in pattern), sum(dy for _, dy in pattern)
+
+
+def follow(lx: int, ly: int, x: int, y: int, runs: list[Run]) -> list[Run]:
+    """Runs of a knot starting at (x, y) behind a leader starting at (lx, ly) and moving by runs.
+
+    Within a run the leader repeats the same pattern, so once the knot's offset to the leader at the start
+    of a pattern repeats, the knot repeats its steps in between too, and the rest of the run is folded at once.
+    There are only 9 touching offsets, so that takes a few patterns at most.
+    """
+    path = Path()
+    for pattern, times in runs:
+        if all(s == STAY for s in pattern):
+            path.repeat((STAY,), len(pattern) * times)  # knots behind a waiting one are touching, they wait too
+            continue
+        pdx, pdy = shift(pattern)
+        seen = {}  # offset at start of pattern -> (patterns done, steps taken) then
+        taken = []
+        done = 0
+        while done < times:
+            offset = lx - x, ly - y
+            if seen is not None and offset in seen:
+                first, mark = seen[offset]
+                cycle = done - first
+                block = tuple(taken[mark:])
+                k = (times - done) // cycle
+                if k:
+                    path.repeat(block, k)
+                    bdx, bdy = shift(block)
+                    x += bdx * k
+                    y += bdy * k
+                    lx += pdx * cycle * k
+                    ly += pdy * cycle * k
+                    done += cycle * k
+                seen = None  # less than a cycle left, just step
+                continue
+            if seen is not None:
+                seen[offset] = done, len(taken)
+            for dx, dy in pattern:
+                lx += dx
+                ly += dy
+                ddx, ddy = lx - x, ly - y
+                if -1 <= ddx <= 1 and -1 <= ddy <= 1:
+                    s = STAY
+                else:
+                    s = sign(ddx), sign(ddy)
+                    x += s[0]
+                    y += s[1]
+                taken.append(s)
+                path.step(s)
+            done += 1
+    return path.finish()
+
+
+def walk(x: int, y: int, runs: list[Run], cells: VisitedCells | None) -> tuple[int, int]:
+    """End of a knot starting at (x, y) and moving by runs, cells it visits are added to cells (if any)."""
+    for pattern, times in runs:
+        dx, dy = shift(pattern)
+        if cells is not None and any(s != STAY for s in pattern):
+            if len(pattern) == 1:
+                cells.add_line(x, y, dx, dy, times)
+            elif abs(dx) + abs(dy) == 1:
+                # every cell the pattern visits is repeated in a straight line
+                px, py = x, y
+                for sx, sy in pattern:
+                    px += sx
+                    py += sy
+                    cells.add_line(px - dx, py - dy, dx, dy, times)
+            else:
+                # other patterns come only from bends of the rope, they last as long as the bend at most
+                # (the ones going nowhere visit the same cells every time)
+                px, py = x, y
+                for _ in range(times if dx or dy else 1):
+                    for sx, sy in pattern:
+                        px += sx
+                        py += sy
+                        cells.add(px, py)
+        x += dx * times
+        y += dy * times
+    return x, y
+
+
+class Rope:
+    """Knots in flat coordinate lists (head first), visited cells recorded for chosen knots only."""
+
+    def __init__(self, knots: int, tracked: Iterable[int]):
+        self.xs = [0] * knots
+        self.ys = [0] * knots
+        self.visited = {k: VisitedCells() for k in tracked}
+        for cells in self.visited.values():
+            cells.add(0, 0)
+
+    def step(self, dx: int, dy: int):
+        xs, ys = self.xs, self.ys
+        x = xs[0] + dx
+        y = ys[0] + dy
+        xs[0], ys[0] = x, y
+        moved = 1
+        for i in range(1, len(xs)):
+            tx, ty = xs[i], ys[i]
+            ddx, ddy = x - tx, y - ty
+            if -1 <= ddx <= 1 and -1 <= ddy <= 1:
+                break  # touching, so this knot and all behind it stay
+            x = tx + (ddx > 0) - (ddx < 0)
+            y = ty + (ddy > 0) - (ddy < 0)
+            xs[i], ys[i] = x, y
+            moved += 1
+        for k, cells in self.visited.items():
+            if k < moved:
+                cells.add(xs[k], ys[k])
+
+    def move(self, dx: int, dy: int, steps: int):
+        # both give the same rope and cells; following runs pays off only for long moves
+        if steps <= STEP_MAX:
+            for _ in range(steps):
+                self.step(dx, dy)
+        else:
+            self.follow_runs(dx, dy, steps)
+
+    def follow_runs(self, dx: int, dy: int, steps: int):
+        """Move head steps times by (dx, dy); knot by knot, each one follows the runs of the one before it.
+
+        O(knots * runs), no matter how long the move is; a rope pulled straight has a few runs per knot.
+        """
+        xs, ys = self.xs, self.ys
+        runs = [(((dx, dy),), steps)]
+        for k in range(len(xs)):
+            if k:
+                runs = follow(lx, ly, xs[k], ys[k], runs)
+                if all(s == STAY for pattern, _ in runs for s in pattern):
+                    break  # this knot stays, so do all behind it
+            lx, ly = xs[k], ys[k]  # start of the leader of the next knot
+            xs[k], ys[k] = walk(xs[k], ys[k], runs, self.visited.get(k))
+
 
-@dataclass
-class Point:
-    x: int
-    y: int
-
-    def move(self, vx: int, vy: int):
-        self.x += vx
-        self.y += vy
-
-
-def sign(x: int) -> int:
-    return (x > 0) - (x < 0)
-
-
-def is_touching(h: Point, t: Point) -> bool:
-    return abs(h.x - t.x) <= 1 and abs(h.y - t.y) <= 1
-
-
-def part1(input_txt: str) -> int:
-    with open(input_txt) as f:
-        lines = map(lambda x: x.strip(), f.readlines())
-        h = Point(0, 0)
-        t = Point(0, 0)
-        visited = {(t.x, t.y)}
-        for move in lines:
-            where, steps = move.split()
-            for s in range(int(steps)):
-                vx, vy = DIRS[where]
-                h.move(vx, vy)
-                if not is_touching(h, t):
-                    t.move(sign(h.x - t.x), sign(h.y - t.y))
-                    visited.add((t.x, t.y))
-        return len(visited)
-
-
-def part2(input_txt: str) -> int:
-    with open(input_txt) as f:
-        lines = map(lambda x: x.strip(), f.readlines())
-        rope = [Point(0, 0) for _ in range(10)]
-        visited = {(rope[9].x, rope[9].y)}
-        for move in lines:
-            where, steps = move.split()
-            for s in range(int(steps)):
-                vx, vy = DIRS[where]
-                rope[0].move(vx, vy)
-                for i in range(1, 10):
-                    h = rope[i - 1]
-                    t = rope[i]
-                    if not is_touching(h, t):
-                        t.move(sign(h.x - t.x), sign(h.y - t.y))
-                visited.add((rope[9].x, rope[9].y))
-        return len(visited)
+def solve(input_txt: str, knots: int = 10, tracked: tuple[int, ...] = (1, 9)) -> tuple[int, ...]:
+    # knot 1 of a long rope moves exactly as the tail of a 2-knot rope, so one rope answers both parts
+    rope = Rope(knots, tracked)
+    for line in reader.lines(input_txt):
+        where, steps = reader.text(line).split()
+        rope.move(*DIRS[where], int(steps))
+    return tuple(len(rope.visited[k]) for k in tracked)
 
 
 if __name__ == "__main__":
-    p1_ans = part1("input.txt")
+    p1_ans, p2_ans = solve("input.txt")
     print(f"part1: {p1_ans}")
-    p2_ans = part2("input.txt")
     print(f"part2: {p2_ans}")
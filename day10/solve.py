@@ -1,22 +1,22 @@
-from pydantic.dataclasses import dataclass
 from dataclasses import field
 
+from aoc import reader
+from aoc.model import dataclass
+
 
 def part1(input_txt: str) -> int:
-    with open(input_txt) as f:
-        lines = map(lambda v: v.strip(), f.readlines())
-        x = 1
-        x_at_cycle = [x]
-        for line in lines:
-            tokens = line.split()
-            match tokens:
-                case ["noop"]:
-                    x_at_cycle.append(x)
-                case ["addx", val]:
-                    x_at_cycle.append(x)
-                    x_at_cycle.append(x)
-                    x += int(val)
-        return sum([x_at_cycle[i] * i for i in range(20, 221, 40)])
+    x = 1
+    x_at_cycle = [x]
+    for line in reader.lines(input_txt):
+        tokens = reader.text(line).split()
+        match tokens:
+            case ["noop"]:
+                x_at_cycle.append(x)
+            case ["addx", val]:
+                x_at_cycle.append(x)
+                x_at_cycle.append(x)
+                x += int(val)
+    return sum([x_at_cycle[i] * i for i in range(20, 221, 40)])
 
 
 @dataclass
@@ -46,20 +46,18 @@ def draw(x: int, s: Screen):
 
 
 def part2(input_txt: str):
-    with open(input_txt) as f:
-        lines = map(lambda v: v.strip(), f.readlines())
-        x = 1
-        s = Screen()
-        for line in lines:
-            tokens = line.split()
-            match tokens:
-                case ["noop"]:
-                    draw(x, s)
-                case ["addx", val]:
-                    draw(x, s)
-                    draw(x, s)
-                    x += int(val)
-        s.print()
+    x = 1
+    s = Screen()
+    for line in reader.lines(input_txt):
+        tokens = reader.text(line).split()
+        match tokens:
+            case ["noop"]:
+                draw(x, s)
+            case ["addx", val]:
+                draw(x, s)
+                draw(x, s)
+                x += int(val)
+    s.print()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from functools import reduce
 
+from aoc import reader
+from aoc.cache import parse_cache
+
 
 @dataclass
 class Monkey:
@@ -12,19 +15,18 @@ class Monkey:
     throw_if_false: int
 
 
+@parse_cache
 def parse_monkeys(input_txt: str) -> list[Monkey]:
-    with open(input_txt) as f:
-        monkeys_str = f.read().split("\n\n")
-        monkeys = []
-        for i, m_str in enumerate(monkeys_str):
-            m_str = m_str.splitlines()
-            items = list(map(int, m_str[1].split(":")[1].split(",")))
-            operation = m_str[2].split("=")[1].strip()
-            divisible = int(m_str[3].split()[3])
-            throw_if_true = int(m_str[4].split()[5])
-            throw_if_false = int(m_str[5].split()[5])
-            monkeys.append(Monkey(i, items, operation, divisible, throw_if_true, throw_if_false))
-        return monkeys
+    monkeys = []
+    for i, block in enumerate(reader.blocks(input_txt)):
+        m_lines = list(reader.split_lines(block))
+        items = reader.ints(m_lines[1])
+        operation = reader.text(m_lines[2]).split("=")[1].strip()
+        [divisible] = reader.ints(m_lines[3])
+        [throw_if_true] = reader.ints(m_lines[4])
+        [throw_if_false] = reader.ints(m_lines[5])
+        monkeys.append(Monkey(i, items, operation, divisible, throw_if_true, throw_if_false))
+    return monkeys
 
 
 def part1(input_txt: str) -> int:
@@ -1,18 +1,21 @@
 from collections import deque
 from typing import Iterable
 
+from aoc import reader
+from aoc.cache import parse_cache
+
 INF = 424242
 
 
+@parse_cache
 def parse_map(input_txt) -> list[list[int]]:
-    with open(input_txt) as f:
-        m = []
-        for line in f:
-            row = [INF] + [ord(c) for c in line.strip()] + [INF]
-            m.append(row)
-        sentinels = [INF for _ in range(len(m[0]))]
-        m = [sentinels] + m + [sentinels]
-        return m
+    m = []
+    for line in reader.lines(input_txt):
+        row = [INF] + list(line) + [INF]  # bytes are ord() of characters already
+        m.append(row)
+    sentinels = [INF for _ in range(len(m[0]))]
+    m = [sentinels] + m + [sentinels]
+    return m
 
 
 def find_pos(m: list[list[int]], v: int) -> Iterable[tuple[int, int]]:
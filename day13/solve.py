@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from functools import cmp_to_key
 
+from aoc import reader
+from aoc.cache import parse_cache
+
 
 @dataclass
 class Packets:
@@ -8,14 +11,13 @@ class Packets:
     b: list
 
 
+@parse_cache(shared=True)
 def parse_packets(input_txt) -> list[Packets]:
-    with open(input_txt) as f:
-        pairs_str = f.read().split("\n\n")
-        ret = []
-        for ps in pairs_str:
-            a, b = map(eval, ps.split())
-            ret.append(Packets(a, b))
-        return ret
+    ret = []
+    for block in reader.blocks(input_txt):
+        a, b = map(eval, reader.text(block).split())
+        ret.append(Packets(a, b))
+    return ret
 
 
 def compare(a: list, b: list) -> int:
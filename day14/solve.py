@@ -1,5 +1,8 @@
 from dataclasses import dataclass, field
 
+from aoc import reader
+from aoc.cache import parse_cache
+
 N = 1009
 
 
@@ -10,26 +13,25 @@ class Cave:
     max_y_taken: int
 
 
+@parse_cache
 def parse_cave(input_txt) -> Cave:
-    with open(input_txt) as f:
-        segments = []
-        for line in f.readlines():
-            points_str = map(lambda x: x.strip(), line.split("->"))
-            points = [s.split(",") for s in points_str]
-            points = [(int(t[0]), int(t[1])) for t in points]
-            for i in range(1, len(points)):
-                a = points[i - 1]
-                b = points[i]
-                segments += [(*a, *b)]
-        taken = [[0] * N for _ in range(N)]
-        max_y = 0
-        for seg in segments:
-            x1, y1, x2, y2 = seg
-            max_y = max(max_y, y1, y2)
-            for x in range(min(x1, x2), max(x1, x2) + 1):
-                for y in range(min(y1, y2), max(y1, y2) + 1):
-                    taken[y][x] = 1
-        return Cave(segments, taken, max_y)
+    segments = []
+    for line in reader.lines(input_txt):
+        coords = reader.ints(line)
+        points = list(zip(coords[::2], coords[1::2]))
+        for i in range(1, len(points)):
+            a = points[i - 1]
+            b = points[i]
+            segments += [(*a, *b)]
+    taken = [[0] * N for _ in range(N)]
+    max_y = 0
+    for seg in segments:
+        x1, y1, x2, y2 = seg
+        max_y = max(max_y, y1, y2)
+        for x in range(min(x1, x2), max(x1, x2) + 1):
+            for y in range(min(y1, y2), max(y1, y2) + 1):
+                taken[y][x] = 1
+    return Cave(segments, taken, max_y)
 
 
 def simulate_sand(c: Cave, start_pos: tuple[int, int], infinite_fall: bool) -> bool:
@@ -1,4 +1,4 @@
-import re
+from aoc import reader
 
 Sensor = tuple[int, int, int]
 
@@ -40,15 +40,14 @@ def calc_taken_in_row(sensors: list[Sensor], y: int) -> int:
 
 
 def part1(input_txt: str, row: int) -> int:
-    with open(input_txt) as f:
-        sensors = []
-        beacons = set()
-        for line in f.readlines():
-            sx, sy, bx, by = map(int, re.findall(r"-?\d+", line))
-            beacons.add((bx, by))
-            sensors.append((sx, sy, manhattan(sx, sy, bx, by)))
-        beacons_in_row = len([y for _, y in beacons if y == row])
-        return calc_taken_in_row(sensors, row) - beacons_in_row
+    sensors = []
+    beacons = set()
+    for line in reader.lines(input_txt):
+        sx, sy, bx, by = reader.ints(line)
+        beacons.add((bx, by))
+        sensors.append((sx, sy, manhattan(sx, sy, bx, by)))
+    beacons_in_row = len([y for _, y in beacons if y == row])
+    return calc_taken_in_row(sensors, row) - beacons_in_row
 
 
 def get_free_x_in_row(sensors: list[Sensor], y: int, max_x: int) -> int | None:
@@ -72,15 +71,14 @@ def get_free_x_in_row(sensors: list[Sensor], y: int, max_x: int) -> int | None:
 
 
 def part2(input_txt: str, max_xy: int) -> int:
-    with open(input_txt) as f:
-        sensors = []
-        for line in f.readlines():
-            sx, sy, bx, by = map(int, re.findall(r"-?\d+", line))
-            sensors.append((sx, sy, manhattan(sx, sy, bx, by)))
-        for y in range(max_xy):
-            x = get_free_x_in_row(sensors, y, max_xy)
-            if x is not None:
-                return x * 4000000 + y
+    sensors = []
+    for line in reader.lines(input_txt):
+        sx, sy, bx, by = reader.ints(line)
+        sensors.append((sx, sy, manhattan(sx, sy, bx, by)))
+    for y in range(max_xy):
+        x = get_free_x_in_row(sensors, y, max_xy)
+        if x is not None:
+            return x * 4000000 + y
 
 
 if __name__ == "__main__":
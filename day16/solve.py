@@ -1,6 +1,11 @@
 from dataclasses import dataclass, field
 from typing import Iterable
-import re
+
+from aoc import reader
+from aoc.cache import parse_cache
+from aoc.lazy import lazy_import
+
+re = lazy_import("re")
 
 INF = 1_000_000_000
 
@@ -43,16 +48,16 @@ class Graph:
         self.dist = dist
 
 
+@parse_cache(shared=True)
 def build_graph(input_txt: str) -> Graph:
-    with open(input_txt) as f:
-        g = Graph()
-        lines = map(lambda v: v.strip(), f.readlines())
-        for line in lines:
-            match = re.match(r"Valve ([A-Z]+) has flow rate=(\d+); tunnels? leads? to valves? ([A-Z, ]+)", line)
-            src_node, flow_rate, dst_nodes = match.group(1), int(match.group(2)), match.group(3).split(", ")
-            g.add_node(src_node, flow_rate, dst_nodes)
-        g.calc_dist()
-        return g
+    g = Graph()
+    for line in reader.lines(input_txt):
+        match = re.match(r"Valve ([A-Z]+) has flow rate=(\d+); tunnels? leads? to valves? ([A-Z, ]+)",
+                         reader.text(line))
+        src_node, flow_rate, dst_nodes = match.group(1), int(match.group(2)), match.group(3).split(", ")
+        g.add_node(src_node, flow_rate, dst_nodes)
+    g.calc_dist()
+    return g
 
 
 def gen_paths(g: Graph, node: int, time_left: int, to_visit: set[int], curr_path: list[int]) -> Iterable[list[int]]:
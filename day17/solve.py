@@ -1,6 +1,8 @@
 from dataclasses import field
 from typing import Self
-from pydantic.dataclasses import dataclass
+
+from aoc import reader
+from aoc.model import dataclass
 
 
 @dataclass(frozen=True)
@@ -8,15 +10,19 @@ class Rock:
     blocks: list[tuple[int, int]]
 
 
+# rocks are frozen, so all sequences (and all inputs solved by one process) can share them
+ROCKS = [
+    Rock([(0, 0), (1, 0), (2, 0), (3, 0)]),
+    Rock([(0, 1), (1, 1), (2, 1), (1, 0), (1, 2)]),
+    Rock([(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)]),
+    Rock([(0, 0), (0, 1), (0, 2), (0, 3)]),
+    Rock([(0, 0), (1, 0), (0, 1), (1, 1)])
+]
+
+
 @dataclass
 class RockSequence:
-    rocks: list[Rock] = field(default_factory=lambda: [
-        Rock([(0, 0), (1, 0), (2, 0), (3, 0)]),
-        Rock([(0, 1), (1, 1), (2, 1), (1, 0), (1, 2)]),
-        Rock([(0, 0), (1, 0), (2, 0), (2, 1), (2, 2)]),
-        Rock([(0, 0), (0, 1), (0, 2), (0, 3)]),
-        Rock([(0, 0), (1, 0), (0, 1), (1, 1)])
-    ])
+    rocks: list[Rock] = field(default_factory=lambda: ROCKS)
     i: int = 0
 
     def next_rock(self) -> Rock:
@@ -111,12 +117,11 @@ def simulate(b: Board, push_seq: PushSequence, rock_seq: RockSequence, rounds: i
 
 
 def part1(input_txt: str) -> int:
-    with open(input_txt) as f:
-        b = Board()
-        push_seq = PushSequence(f.read().strip())
-        rock_seq = RockSequence()
-        b = simulate(b, push_seq, rock_seq, 2022, None)
-        return b.last_filled_row
+    b = Board()
+    push_seq = PushSequence(reader.text(reader.mapped(input_txt)).strip())
+    rock_seq = RockSequence()
+    b = simulate(b, push_seq, rock_seq, 2022, None)
+    return b.last_filled_row
 
 
 def find_cycle(b: Board, max_start_pos: int, max_cycle_len: int) -> tuple[int, int]:
@@ -128,29 +133,28 @@ def find_cycle(b: Board, max_start_pos: int, max_cycle_len: int) -> tuple[int, i
 
 
 def part2(input_txt: str) -> int:
-    with open(input_txt) as f:
-        push_str = f.read().strip()
-        rounds = 1000000000000
-        rounds_for_cycle = 7_000
-        b = simulate(Board(), PushSequence(push_str), RockSequence(), rounds_for_cycle, None)
-        cycle_start, cycle_length = find_cycle(b, 1_000, 5_000)
-
-        b = Board()
-        push_seq = PushSequence(push_str)
-        rock_seq = RockSequence()
-        b = simulate(b, push_seq, rock_seq, rounds_for_cycle, cycle_start)
-        cycle_start = b.last_filled_row
-        cycle_start_rounds = b.rocks_count
-        b = simulate(b, push_seq, rock_seq, rounds_for_cycle, cycle_start + cycle_length)
-        cycle_length_rounds = b.rocks_count - cycle_start_rounds
-
-        rounds -= cycle_start_rounds
-        cycle_count, rounds_left = divmod(rounds, cycle_length_rounds)
-
-        rows_before_last_run = b.last_filled_row
-        b = simulate(b, push_seq, rock_seq, rounds_left, None)
-        last_run_rows = b.last_filled_row - rows_before_last_run
-        return cycle_start + cycle_count * cycle_length + last_run_rows
+    push_str = reader.text(reader.mapped(input_txt)).strip()
+    rounds = 1000000000000
+    rounds_for_cycle = 7_000
+    b = simulate(Board(), PushSequence(push_str), RockSequence(), rounds_for_cycle, None)
+    cycle_start, cycle_length = find_cycle(b, 1_000, 5_000)
+
+    b = Board()
+    push_seq = PushSequence(push_str)
+    rock_seq = RockSequence()
+    b = simulate(b, push_seq, rock_seq, rounds_for_cycle, cycle_start)
+    cycle_start = b.last_filled_row
+    cycle_start_rounds = b.rocks_count
+    b = simulate(b, push_seq, rock_seq, rounds_for_cycle, cycle_start + cycle_length)
+    cycle_length_rounds = b.rocks_count - cycle_start_rounds
+
+    rounds -= cycle_start_rounds
+    cycle_count, rounds_left = divmod(rounds, cycle_length_rounds)
+
+    rows_before_last_run = b.last_filled_row
+    b = simulate(b, push_seq, rock_seq, rounds_left, None)
+    last_run_rows = b.last_filled_row - rows_before_last_run
+    return cycle_start + cycle_count * cycle_length + last_run_rows
 
 
 if __name__ == "__main__":
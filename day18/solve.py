@@ -1,12 +1,15 @@
 from typing import Iterable
 import sys
 
+from aoc import reader
+from aoc.cache import parse_cache
+
 Point = tuple[int, int, int]
 
 
+@parse_cache(shared=True)
 def parse_graph(input_txt: str) -> set[Point]:
-    with open(input_txt) as f:
-        return {tuple(map(int, x.split(","))) for x in f.readlines()}
+    return {tuple(reader.ints(line)) for line in reader.lines(input_txt)}
 
 
 def neighbours(p: Point) -> Iterable[Point]:
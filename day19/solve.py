@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import Self
 from collections import deque
-import re
+
+from aoc import reader
 
 
 @dataclass
@@ -15,9 +16,9 @@ class Blueprint:
     geo_r_cost_obs: int
 
     @classmethod
-    def from_str(cls, s: str) -> Self:
+    def from_line(cls, line: reader.Buffer) -> Self:
         i, ore_r_cost_ore, clay_r_cost_ore, obs_r_cost_ore, \
-            obs_r_cost_clay, geo_r_cost_ore, geo_r_cost_obs = map(int, re.findall(r"\d+", s))
+            obs_r_cost_clay, geo_r_cost_ore, geo_r_cost_obs = reader.ints(line)
         return cls(i, ore_r_cost_ore, clay_r_cost_ore, obs_r_cost_ore,
                    obs_r_cost_clay, geo_r_cost_ore, geo_r_cost_obs)
 
@@ -75,27 +76,23 @@ def solve(b: Blueprint, minutes: int) -> int:
 
 
 def part1(input_txt: str) -> int:
-    with open(input_txt) as f:
-        lines = map(lambda x: x.strip(), f.readlines())
-        blueprints = [Blueprint.from_str(l) for l in lines]
-        res = 0
-        for b in blueprints:
-            v = solve(b, 24)
-            print(b.id, v)
-            res += b.id * v
-        return res
+    blueprints = [Blueprint.from_line(l) for l in reader.lines(input_txt)]
+    res = 0
+    for b in blueprints:
+        v = solve(b, 24)
+        print(b.id, v)
+        res += b.id * v
+    return res
 
 
 def part2(input_txt: str) -> int:
-    with open(input_txt) as f:
-        lines = map(lambda x: x.strip(), f.readlines())
-        blueprints = [Blueprint.from_str(l) for l in lines]
-        res = 1
-        for b in blueprints[:3]:
-            v = solve(b, 32)
-            print(b.id, v)
-            res *= v
-        return res
+    blueprints = [Blueprint.from_line(l) for l in reader.lines(input_txt)]
+    res = 1
+    for b in blueprints[:3]:
+        v = solve(b, 32)
+        print(b.id, v)
+        res *= v
+    return res
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from typing import Self
 
+from aoc import reader
+from aoc.cache import parse_cache
+
 
 @dataclass
 class Node:
@@ -46,9 +49,9 @@ def dump(e: Node) -> list[int]:
     return res
 
 
+@parse_cache(shared=True)
 def parse_list(input_txt: str) -> list[int]:
-    with open(input_txt) as f:
-        return [int(x) for x in f.readlines()]
+    return list(map(int, reader.lines(input_txt)))
 
 
 def calc_result(nodes):
@@ -1,5 +1,8 @@
 import operator
 
+from aoc import reader
+from aoc.cache import parse_cache
+
 ROOT = "root"
 HUMAN = "humn"
 
@@ -13,17 +16,17 @@ OPS = {
 TREE = dict[str, tuple | None]
 
 
+@parse_cache
 def parse_tree(input_txt: str) -> TREE:
-    with open(input_txt) as f:
-        tree = {}
-        for line in f.readlines():
-            tokens = line.split()
-            match tokens:
-                case [z, x, op, y]:
-                    tree[z[:-1]] = (op, x, y)
-                case [z, v]:
-                    tree[z[:-1]] = (int(v))
-        return tree
+    tree = {}
+    for line in reader.lines(input_txt):
+        tokens = reader.text(line).split()
+        match tokens:
+            case [z, x, op, y]:
+                tree[z[:-1]] = (op, x, y)
+            case [z, v]:
+                tree[z[:-1]] = (int(v))
+    return tree
 
 
 def calc(tree: TREE, node: str) -> int | None:
@@ -1,8 +1,13 @@
-from pydantic.dataclasses import dataclass
 from typing import Self
-import re
 import types
 
+from aoc import reader
+from aoc.cache import parse_cache
+from aoc.lazy import lazy_import
+from aoc.model import dataclass
+
+re = lazy_import("re")
+
 
 @dataclass
 class Tile:
@@ -66,6 +71,12 @@ def parse_moves(moves_str: str) -> list[Move]:
     return moves
 
 
+@parse_cache(shared=True)
+def parse_input(input_txt: str) -> tuple[list[list[Tile]], list[Move]]:
+    maze_block, moves_block = reader.blocks(input_txt)
+    return parse_maze(reader.text(maze_block)), parse_moves(reader.text(moves_block))
+
+
 def find_start(maze: list[list[Tile]]) -> Tile:
     for t in maze[1]:  # first line == sentinels
         if t.val == '.':
@@ -109,34 +120,33 @@ def calc_points(curr_tile: Tile, curr_vec: Vector) -> int:
 
 
 def part1(input_txt: str) -> int:
-    with open(input_txt) as f:
-        maze_str, moves_str = f.read().split("\n\n")
-        maze = parse_maze(maze_str)
-        moves = parse_moves(moves_str)
-        curr_tile = find_start(maze)
-        curr_vec = Direction.RIGHT
-        for move in moves:
-            curr_vec = update_vec(curr_vec, move)
-            for _ in range(move.steps):
-                curr_tile, curr_vec = next_tile(maze, curr_tile, curr_vec)
-        return calc_points(curr_tile, curr_vec)
+    maze, moves = parse_input(input_txt)
+    curr_tile = find_start(maze)
+    curr_vec = Direction.RIGHT
+    for move in moves:
+        curr_vec = update_vec(curr_vec, move)
+        for _ in range(move.steps):
+            curr_tile, curr_vec = next_tile(maze, curr_tile, curr_vec)
+    return calc_points(curr_tile, curr_vec)
+
+
+# x1, x2, y1, y2
+# sentinels included!
+FACES = [
+    (51, 51 + 50, 1, 1 + 50),
+    (101, 101 + 50, 1, 1 + 50),
+    (51, 51 + 50, 51, 51 + 50),
+    (1, 1 + 50, 101, 101 + 50),
+    (51, 51 + 50, 101, 101 + 50),
+    (1, 1 + 50, 151, 151 + 50)
+]
 
 
 def face_3d(x: int, y: int) -> tuple[int, tuple[int, int, int, int]]:
-    # x1, x2, y1, y2
-    # sentinels included!
-    faces = [
-        (51, 51 + 50, 1, 1 + 50),
-        (101, 101 + 50, 1, 1 + 50),
-        (51, 51 + 50, 51, 51 + 50),
-        (1, 1 + 50, 101, 101 + 50),
-        (51, 51 + 50, 101, 101 + 50),
-        (1, 1 + 50, 151, 151 + 50)
-    ]
-    for i, f in enumerate(faces):
+    for i, f in enumerate(FACES):
         x1, x2, y1, y2 = f
         if x1 <= x < x2 and y1 <= y < y2:
-            return i + 1, faces[i]
+            return i + 1, FACES[i]
     raise Exception("should not happen!")
 
 
@@ -240,17 +250,14 @@ def next_tile_3d(maze: list[list[Tile]], curr_tile: Tile, vec: Vector) -> tuple[
 
 
 def part2(input_txt: str) -> int:
-    with open(input_txt) as f:
-        maze_str, moves_str = f.read().split("\n\n")
-        maze = parse_maze(maze_str)
-        moves = parse_moves(moves_str)
-        curr_tile = find_start(maze)
-        curr_vec = Direction.RIGHT
-        for move in moves:
-            curr_vec = update_vec(curr_vec, move)
-            for _ in range(move.steps):
-                curr_tile, curr_vec = next_tile_3d(maze, curr_tile, curr_vec)
-        return calc_points(curr_tile, curr_vec)
+    maze, moves = parse_input(input_txt)
+    curr_tile = find_start(maze)
+    curr_vec = Direction.RIGHT
+    for move in moves:
+        curr_vec = update_vec(curr_vec, move)
+        for _ in range(move.steps):
+            curr_tile, curr_vec = next_tile_3d(maze, curr_tile, curr_vec)
+    return calc_points(curr_tile, curr_vec)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
-from pydantic.dataclasses import dataclass
 from dataclasses import field
 from collections import deque, defaultdict
 
+from aoc import reader
+from aoc.cache import parse_cache
+from aoc.model import dataclass
+
 DIRS = {
     "N": (0, -1),
     "E": (1, 0),
@@ -42,12 +45,12 @@ class Map:
         self.taken.add(where)
 
 
+@parse_cache
 def parse_map(input_txt: str) -> Map:
-    with open(input_txt) as f:
-        lines = map(lambda x: x.strip(), f.readlines())
-        elves = [Elf(x, y) for y, line in enumerate(lines) for x, val in enumerate(line) if val == "#"]
-        taken = {(e.x, e.y) for e in elves}
-        return Map(taken, elves)
+    lines = reader.lines(input_txt)
+    elves = [Elf(x, y) for y, line in enumerate(lines) for x, val in enumerate(line) if val == ord("#")]
+    taken = {(e.x, e.y) for e in elves}
+    return Map(taken, elves)
 
 
 def print_map(m: Map):
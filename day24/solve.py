@@ -3,6 +3,9 @@ from typing import Iterable
 from dataclasses import dataclass
 from collections import deque
 
+from aoc import reader
+from aoc.cache import parse_cache
+
 MAX_MINUTES = 1_000
 
 DIRS = {
@@ -55,17 +58,17 @@ def find_dot(line: str) -> int:
     return [x for x, v in enumerate(line) if v == '.'][0]
 
 
+@parse_cache
 def parse_map(input_txt: str) -> Map:
-    with open(input_txt) as f:
-        lines = list(map(lambda x: x.strip(), f.readlines()))
-        size_y = len(lines) - 2
-        size_x = len(lines[0]) - 2
-        start = (find_dot(lines[0][1:-1]), -1)
-        end = (find_dot(lines[-1][1:-1]), size_y)
-        blizzards = [
-            Blizzard(x, y, DIRS[v]) for y, line in enumerate(lines[1:-1]) for x, v in enumerate(line[1:-1]) if v != "."
-        ]
-        return Map(size_x, size_y, start, end, blizzards)
+    lines = list(map(reader.text, reader.lines(input_txt)))
+    size_y = len(lines) - 2
+    size_x = len(lines[0]) - 2
+    start = (find_dot(lines[0][1:-1]), -1)
+    end = (find_dot(lines[-1][1:-1]), size_y)
+    blizzards = [
+        Blizzard(x, y, DIRS[v]) for y, line in enumerate(lines[1:-1]) for x, v in enumerate(line[1:-1]) if v != "."
+    ]
+    return Map(size_x, size_y, start, end, blizzards)
 
 
 def generate_moves(m: Map, p: Position, occupied_at_min: list[OccupiedSet]) -> Iterable[Position]:
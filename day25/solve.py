@@ -1,3 +1,5 @@
+from aoc import reader
+
 DEC_DIGITS = {
     "=": -2,
     "-": -1,
@@ -31,10 +33,8 @@ def dec2snafu(x: int) -> str:
 
 
 def part1(input_txt: str) -> str:
-    with open(input_txt) as f:
-        lines = map(lambda v: v.strip(), f.readlines())
-        x = sum(snafu2dec(l) for l in lines)
-        return dec2snafu(x)
+    x = sum(snafu2dec(reader.text(l)) for l in reader.lines(input_txt))
+    return dec2snafu(x)
 
 
 def test():